@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Domain Checker Benchmark
+
+Measures DomainChecker throughput without touching public registries.
+A child process serves a fake DNS server (dnspython, UDP) and a fake
+WHOIS port-43 server on localhost, each with configurable latency, error
+rate and rate limit. The checker is pointed at them through its normal
+settings (DNS_NAMESERVERS/DNS_PORT, WHOIS_SERVERS) and driven at
+increasing concurrency:
+
+- single: check_domain_availability() calls, at most N in flight
+- batch:  check_multiple_domains() with N workers (latency = time to each result)
+
+Each run reports throughput, p50/p95/p99 latency, and peak thread and
+file descriptor counts, for both DNS modes (async / thread) unless one
+is selected.
+
+Usage:
+    python domain-checker-benchmark.py
+    python domain-checker-benchmark.py --concurrency 1,10,50,200 --domains 1000
+    python domain-checker-benchmark.py --whois-latency 0.2 --whois-rate 50 --dns-error-rate 0.01
+    python domain-checker-benchmark.py --json bench.json --baseline previous.json   # CI regression gate
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import zlib
+from typing import Any, Dict, List
+
+# Reserved TLD (RFC 2606), so no benchmark query can reach a real registry
+BENCH_TLD = "test"
+
+
+def is_registered(domain: str, ratio: float) -> bool:
+    """Stable pseudo-random registration state shared by both stand-in servers"""
+    return zlib.crc32(domain.encode("utf-8")) % 10000 < ratio * 10000
+
+
+class Bucket:
+    """Non-blocking token bucket: stand-in servers reject instead of waiting"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def _delay(latency: float, jitter: float) -> float:
+    return max(0.0, latency + random.uniform(-jitter, jitter) * latency)
+
+
+class FakeDNSProtocol(asyncio.DatagramProtocol):
+    """Answers A queries: registered names resolve, others get NXDOMAIN
+
+    Over the rate limit the server answers REFUSED; with dns_error_rate
+    it answers SERVFAIL.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        import dns.message
+        import dns.rcode
+        import dns.rrset
+        self.dns = dns
+        self.options = options
+        self.bucket = Bucket(options["dns_rate"])
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        query = self.dns.message.from_wire(data)
+        delay = _delay(self.options["dns_latency"], self.options["jitter"])
+        asyncio.get_event_loop().call_later(delay, self._answer, query, addr)
+
+    def _answer(self, query, addr):
+        dns = self.dns
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name = question.name.to_text().rstrip(".").lower()
+
+        if not self.bucket.take():
+            response.set_rcode(dns.rcode.REFUSED)
+        elif random.random() < self.options["dns_error_rate"]:
+            response.set_rcode(dns.rcode.SERVFAIL)
+        elif is_registered(name, self.options["registered_ratio"]):
+            response.answer.append(dns.rrset.from_text(question.name, 300, "IN", "A", "192.0.2.1"))
+        else:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        self.transport.sendto(response.to_wire(), addr)
+
+
+def _whois_handler(options: Dict[str, Any]):
+    bucket = Bucket(options["whois_rate"])
+
+    async def handle(reader, writer):
+        domain = (await reader.readline()).decode("utf-8", errors="replace").strip().lower()
+        await asyncio.sleep(_delay(options["whois_latency"], options["jitter"]))
+
+        if not bucket.take():
+            writer.write(b"Rate limit exceeded. Try again later.\r\n")
+        elif random.random() < options["whois_error_rate"]:
+            # Drop the connection without an answer, like an overloaded registry
+            writer.transport.abort()
+            return
+        elif is_registered(domain, options["registered_ratio"]):
+            writer.write(f"Domain Name: {domain.upper()}\r\nRegistrar: Benchmark Registrar\r\n".encode("utf-8"))
+        else:
+            writer.write(f'No match for "{domain.upper()}".\r\n'.encode("utf-8"))
+        await writer.drain()
+        writer.close()
+
+    return handle
+
+
+def serve_stand_ins(options: Dict[str, Any], ready):
+    """Child process: run both stand-in servers and report their ports"""
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: FakeDNSProtocol(options), local_addr=("127.0.0.1", 0)
+        )
+        whois_server = await asyncio.start_server(_whois_handler(options), "127.0.0.1", 0, backlog=1024)
+        ready.put((transport.get_extra_info("sockname")[1], whois_server.sockets[0].getsockname()[1]))
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+class ResourceSampler:
+    """Samples thread and open file descriptor counts while a run is active"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak_threads = 0
+        self.peak_fds = None
+        self._task = None
+
+    @staticmethod
+    def open_fds():
+        try:
+            return len(os.listdir("/proc/self/fd"))
+        except OSError:
+            return None
+
+    def _sample(self):
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+        fds = self.open_fds()
+        if fds is not None:
+            self.peak_fds = max(self.peak_fds or 0, fds)
+
+    async def _run(self):
+        while True:
+            self._sample()
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self):
+        self._task = asyncio.get_event_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._sample()
+        self._task.cancel()
+
+
+class BatchContext:
+    """Stand-in for the MCP Context: records when each batch result arrives"""
+
+    def __init__(self, histogram, started: float):
+        self.histogram = histogram
+        self.started = started
+
+    async def report_progress(self, progress, total):
+        self.histogram.record((time.perf_counter() - self.started) * 1_000_000)
+
+    async def info(self, message):
+        pass
+
+
+def _set_concurrency(checker, concurrency: int):
+    checker.batch_concurrency = concurrency
+    checker.tld_concurrency = concurrency
+    checker._tld_semaphores.clear()
+    if checker.whois_client is not None:
+        checker.whois_client.per_server_concurrency = concurrency
+        checker.whois_client._server_semaphores.clear()
+
+
+async def run_single(server, domains: List[str], concurrency: int, histogram) -> List[Dict[str, Any]]:
+    checker = server.domain_checker
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def check(domain):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await checker.check_domain_availability(domain)
+            histogram.record((time.perf_counter() - start) * 1_000_000)
+            return result
+
+    return await asyncio.gather(*(check(domain) for domain in domains))
+
+
+async def run_batch(server, domains: List[str], histogram) -> List[Dict[str, Any]]:
+    response = await server.check_multiple_domains(
+        domains, output="json-compact", ctx=BatchContext(histogram, time.perf_counter())
+    )
+    return json.loads(response)
+
+
+async def benchmark(server, args) -> List[Dict[str, Any]]:
+    from mcp_metrics import LatencyHistogram
+
+    checker = server.domain_checker
+    rows = []
+    run_id = 0
+    for dns_mode in args.dns_modes:
+        checker.dns_mode = dns_mode
+        for mode in args.modes:
+            for concurrency in args.concurrency:
+                run_id += 1
+                # Fresh names per run, so no run is served from the lookup cache
+                domains = [f"bench{run_id}-{i}.{BENCH_TLD}" for i in range(args.domains)]
+                _set_concurrency(checker, concurrency)
+                histogram = LatencyHistogram()
+
+                with ResourceSampler() as sampler:
+                    start = time.perf_counter()
+                    if mode == "single":
+                        results = await run_single(server, domains, concurrency, histogram)
+                    else:
+                        results = await run_batch(server, domains, histogram)
+                    elapsed = time.perf_counter() - start
+
+                verdicts = [result["available"] for result in results]
+                rows.append({
+                    "mode": mode,
+                    "dns_mode": dns_mode,
+                    "concurrency": concurrency,
+                    "domains": len(domains),
+                    "seconds": round(elapsed, 3),
+                    "throughput": round(len(domains) / elapsed, 1),
+                    "p50_ms": histogram.percentile(50) / 1000,
+                    "p95_ms": histogram.percentile(95) / 1000,
+                    "p99_ms": histogram.percentile(99) / 1000,
+                    "max_ms": histogram.max / 1000,
+                    "available": verdicts.count(True),
+                    "taken": verdicts.count(False),
+                    "unclear": verdicts.count(None),
+                    "peak_threads": sampler.peak_threads,
+                    "peak_fds": sampler.peak_fds
+                })
+                print(_format_row(rows[-1]), flush=True)
+    return rows
+
+
+_COLUMNS = [
+    ("mode", 6), ("dns_mode", 8), ("concurrency", 11), ("throughput", 10), ("p50_ms", 9),
+    ("p95_ms", 9), ("p99_ms", 9), ("unclear", 7), ("peak_threads", 12), ("peak_fds", 8)
+]
+
+
+def _format_row(row: Dict[str, Any]) -> str:
+    return " ".join(f"{str(row[key]):>{width}}" for key, width in _COLUMNS)
+
+
+def compare_with_baseline(rows: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> List[str]:
+    """Runs whose throughput fell more than max_regression below the baseline"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (row["mode"], row["dns_mode"], row["concurrency"]): row
+            for row in json.load(f)["results"]
+        }
+
+    regressions = []
+    for row in rows:
+        previous = baseline.get((row["mode"], row["dns_mode"], row["concurrency"]))
+        if previous and row["throughput"] < previous["throughput"] * (1 - max_regression):
+            regressions.append(
+                f"{row['mode']}/{row['dns_mode']}/c={row['concurrency']}: "
+                f"{row['throughput']}/s vs {previous['throughput']}/s"
+            )
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the domain checker against local DNS/WHOIS stand-ins")
+    parser.add_argument("--domains", type=int, default=500, help="domains per run")
+    parser.add_argument("--concurrency", default="1,10,50,100", help="comma-separated concurrency levels")
+    parser.add_argument("--modes", default="single,batch", help="single and/or batch")
+    parser.add_argument("--dns-modes", default="async,thread", help="async and/or thread")
+    parser.add_argument("--registered-ratio", type=float, default=0.5, help="share of names that are registered")
+    parser.add_argument("--dns-latency", type=float, default=0.005, help="seconds per DNS answer")
+    parser.add_argument("--dns-error-rate", type=float, default=0.0, help="share of SERVFAIL answers")
+    parser.add_argument("--dns-rate", type=float, default=0, help="DNS queries per second, 0 = unlimited")
+    parser.add_argument("--whois-latency", type=float, default=0.05, help="seconds per WHOIS answer")
+    parser.add_argument("--whois-error-rate", type=float, default=0.0, help="share of dropped WHOIS connections")
+    parser.add_argument("--whois-rate", type=float, default=0, help="WHOIS queries per second, 0 = unlimited")
+    parser.add_argument("--jitter", type=float, default=0.2, help="relative latency jitter")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="results file of an earlier run to compare throughput against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed throughput drop vs baseline")
+    args = parser.parse_args(argv)
+    args.concurrency = [int(value) for value in args.concurrency.split(",")]
+    args.modes = [value.strip() for value in args.modes.split(",")]
+    args.dns_modes = [value.strip() for value in args.dns_modes.split(",")]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {
+        "registered_ratio": args.registered_ratio,
+        "dns_latency": args.dns_latency,
+        "dns_error_rate": args.dns_error_rate,
+        "dns_rate": args.dns_rate,
+        "whois_latency": args.whois_latency,
+        "whois_error_rate": args.whois_error_rate,
+        "whois_rate": args.whois_rate,
+        "jitter": args.jitter
+    }
+
+    ready = multiprocessing.Queue()
+    stand_ins = multiprocessing.Process(target=serve_stand_ins, args=(options, ready), daemon=True)
+    stand_ins.start()
+    try:
+        dns_port, whois_port = ready.get(timeout=30)
+
+        # Point the checker at the stand-ins before it reads its settings; client-side
+        # limits are lifted unless set explicitly, so the server settings are what is measured
+        os.environ["DNS_NAMESERVERS"] = "127.0.0.1"
+        os.environ["DNS_PORT"] = str(dns_port)
+        os.environ["WHOIS_CLIENT"] = "native"
+        os.environ["WHOIS_SERVERS"] = f"{BENCH_TLD}=127.0.0.1:{whois_port}"
+        os.environ.setdefault("DNS_RATE_PER_NAMESERVER", "0")
+        os.environ.setdefault("DOMAIN_CACHE_SIZE", "0")
+        os.environ.setdefault("DOMAIN_INDEX_PATH", "")
+        import domain_checker as server
+
+        print(f"Stand-ins: DNS 127.0.0.1:{dns_port}, WHOIS 127.0.0.1:{whois_port} "
+              f"({args.domains} domains per run)\n")
+        print(" ".join(f"{key:>{width}}" for key, width in _COLUMNS))
+        rows = asyncio.run(benchmark(server, args))
+    finally:
+        stand_ins.terminate()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"options": options, "domains": args.domains, "results": rows}, f, indent=2)
+
+    if args.baseline:
+        regressions = compare_with_baseline(rows, args.baseline, args.max_regression)
+        if regressions:
+            print(f"\nThroughput regressions (> {args.max_regression:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo throughput regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
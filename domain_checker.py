@@ -0,0 +1,1052 @@
+#!/usr/bin/env python3
+"""
+Domain Checker MCP Server
+
+One engine for both deployment modes; the transport is chosen on the
+command line:
+
+    python domain_checker.py                                   # stdio, for local MCP clients
+    python domain_checker.py --transport streamable-http       # remote, on $PORT (default 8080)
+
+domain-checker.py (DigitalOcean run command) and local-domain-checker.py
+(fastmcp dev / local client configs) are thin entry points for the two modes.
+
+Remote example MCP client configuration:
+{
+  "mcpServers": {
+    "domain-checker": {
+      "url": "https://remote-mcp-server-8h8cr.ondigitalocean.app/mcp",
+      "description": "Check domain availability"
+    }
+  }
+}
+
+whois and dnspython are imported on the first check rather than at
+startup, so stdio clients get their handshake without waiting for them.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+from fastmcp import Context, FastMCP
+from domain_index import DomainIndex
+from mcp_metrics import ServerMetrics
+from whois_client import RDAP_SERVERS, WHOIS_SERVERS, WhoisClient
+
+# Configure logging for the MCP server
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("domain-checker")
+# The RDAP client would otherwise log every HTTP request at INFO level
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Create the FastMCP server instance
+# This is the main MCP server object that will handle client connections
+mcp = FastMCP(
+    name="Domain Checker",
+    instructions="When you are asked about domain availability or to check if a domain is available for registration, call the appropriate function."
+)
+
+# Instrument every tool and resource registered below with latency histograms,
+# in-flight gauges and error counters (metrics://server and GET /metrics)
+metrics = ServerMetrics("domain-checker")
+metrics.instrument(mcp)
+metrics.register_endpoints(mcp)
+
+# DNS lookup mode: "async" sends queries from the event loop (dns.asyncresolver),
+# "thread" wraps the blocking resolver in the default thread pool
+DNS_MODE = os.environ.get("DNS_MODE", "async")
+# Maximum number of DNS queries in flight at once
+DNS_CONCURRENCY = int(os.environ.get("DNS_CONCURRENCY", "256"))
+# Queries per second allowed against each nameserver; 0 (default) means unlimited.
+# When set, it is the DNS throughput ceiling: (number of nameservers) x rate lookups per second.
+DNS_RATE_PER_NAMESERVER = float(os.environ.get("DNS_RATE_PER_NAMESERVER", "0"))
+# Batch engine limits: domains checked at once, and at once per TLD (WHOIS servers are per registry)
+DOMAIN_BATCH_CONCURRENCY = int(os.environ.get("DOMAIN_BATCH_CONCURRENCY", "20"))
+DOMAIN_TLD_CONCURRENCY = int(os.environ.get("DOMAIN_TLD_CONCURRENCY", "4"))
+# Open queries per WHOIS/RDAP server in the native client, across all tools. Within a
+# batch both limits apply, so a registry sees at most min(TLD, server) lookups at once.
+WHOIS_SERVER_CONCURRENCY = int(os.environ.get("WHOIS_SERVER_CONCURRENCY", "4"))
+# Retries for throttled WHOIS lookups, with exponential backoff starting at WHOIS_RETRY_BACKOFF seconds
+WHOIS_MAX_RETRIES = int(os.environ.get("WHOIS_MAX_RETRIES", "3"))
+WHOIS_RETRY_BACKOFF = float(os.environ.get("WHOIS_RETRY_BACKOFF", "1.0"))
+
+# Registered-domain index built with domain_index.py from a zone file or bulk list.
+# DOMAIN_INDEX_OFFLINE=1 treats names missing from a covered TLD as available
+# without any network lookup (for test suites and offline use).
+DOMAIN_INDEX_PATH = os.environ.get("DOMAIN_INDEX_PATH", "")
+DOMAIN_INDEX_OFFLINE = os.environ.get("DOMAIN_INDEX_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Name sweep (suggest_domains): DNS pre-filter workers, default TLDs and affixes for candidates
+SWEEP_DNS_CONCURRENCY = int(os.environ.get("SWEEP_DNS_CONCURRENCY", "64"))
+SWEEP_DEFAULT_TLDS = ["com", "net", "org", "io", "dev", "app"]
+NAME_PREFIXES = ["get", "try", "my", "go", "the"]
+NAME_SUFFIXES = ["hq", "app", "hub", "labs", "ly"]
+# Valid DNS label: letters, digits and inner hyphens, at most 63 characters
+_LABEL_PATTERN = re.compile(r"^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$")
+
+# WHOIS client: "native" queries RDAP / port-43 servers directly for known TLDs
+# (python-whois remains the fallback for the rest), "python-whois" uses it for everything
+WHOIS_CLIENT = os.environ.get("WHOIS_CLIENT", "native")
+WHOIS_TIMEOUT = float(os.environ.get("WHOIS_TIMEOUT", "10"))
+
+def _server_overrides(value: str) -> Dict[str, str]:
+    """Parse "tld=server,tld=server" overrides (e.g. "com=127.0.0.1:4343" for a local stand-in)"""
+    overrides = {}
+    for item in value.split(","):
+        tld, _, server = item.partition("=")
+        if tld.strip() and server.strip():
+            overrides[tld.strip().lower().lstrip(".")] = server.strip()
+    return overrides
+
+# Per-TLD overrides; an explicit port-43 server takes precedence over RDAP for that TLD
+WHOIS_SERVER_OVERRIDES = _server_overrides(os.environ.get("WHOIS_SERVERS", ""))
+RDAP_SERVER_OVERRIDES = _server_overrides(os.environ.get("RDAP_SERVERS", ""))
+
+# WHOIS failure texts that indicate rate limiting rather than a real answer.
+# Connection errors (refused, reset) are not retried: they rarely clear within the backoff.
+_THROTTLE_PATTERN = re.compile(
+    r"rate limit|limit exceeded|too many|quota|try again|temporarily",
+    re.IGNORECASE
+)
+
+# Optional comma-separated nameserver list, defaults to the system configuration
+DNS_NAMESERVERS = [ns.strip() for ns in os.environ.get("DNS_NAMESERVERS", "").split(",") if ns.strip()]
+# Port the nameservers listen on (non-standard ports are used by local stand-ins)
+DNS_PORT = int(os.environ.get("DNS_PORT", "53"))
+
+# Lookup libraries, imported on first use by _import_whois() / _import_dns()
+whois = None
+dns = None
+
+def _import_whois():
+    global whois
+    if whois is None:
+        import whois
+    return whois
+
+def _import_dns():
+    global dns
+    if dns is None:
+        import dns.asyncresolver
+        import dns.resolver
+    return dns
+
+class RateLimiter:
+    """Token bucket limiter for async callers
+    
+    Each acquire() takes one token; when the bucket is empty the caller
+    sleeps until the next token is due instead of busy-waiting.
+    """
+    
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+    
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Lookup cache: in-memory LRU size, TTLs in seconds, optional SQLite file that survives restarts
+DOMAIN_CACHE_SIZE = int(os.environ.get("DOMAIN_CACHE_SIZE", "10000"))
+WHOIS_CACHE_TTL = float(os.environ.get("WHOIS_CACHE_TTL", "3600"))
+NEGATIVE_CACHE_TTL = float(os.environ.get("NEGATIVE_CACHE_TTL", "300"))
+DOMAIN_CACHE_DB = os.environ.get("DOMAIN_CACHE_DB", "")
+
+def normalize_domain(domain: str) -> str:
+    """Canonical form of a domain name: trimmed, lowercase, without trailing dot"""
+    return domain.strip().lower().rstrip(".")
+
+
+class DomainCache:
+    """Two-tier cache for WHOIS and DNS probe results
+    
+    The memory tier is an LRU of (kind, domain) -> (expiry, result). When a
+    SQLite path is configured, entries are also written there and misses
+    in memory fall back to it, so cached answers survive restarts. Each
+    entry carries its own TTL: DNS answers use the record TTL, WHOIS
+    registrations WHOIS_CACHE_TTL and negative answers NEGATIVE_CACHE_TTL.
+    Domains are keyed by normalize_domain(), so "Example.COM" and
+    "example.com." share one entry in both tiers. get() returns a copy of
+    the stored result, identical to the original probe answer.
+    """
+    
+    def __init__(self, maxsize: int = DOMAIN_CACHE_SIZE, whois_ttl: float = WHOIS_CACHE_TTL,
+                 negative_ttl: float = NEGATIVE_CACHE_TTL, db_path: str = DOMAIN_CACHE_DB):
+        self.maxsize = maxsize
+        self.whois_ttl = whois_ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "sqlite_hits": 0}
+        
+        self._db = None
+        self._db_lock = threading.Lock()
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS domain_cache ("
+                "kind TEXT, domain TEXT, expires REAL, value TEXT, PRIMARY KEY (kind, domain))"
+            )
+            self._db.commit()
+    
+    def _remember(self, key: tuple, expires: float, value: Dict[str, Any]):
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+    
+    def _db_get(self, kind: str, domain: str):
+        with self._db_lock:
+            return self._db.execute(
+                "SELECT expires, value FROM domain_cache WHERE kind = ? AND domain = ?", (kind, domain)
+            ).fetchone()
+    
+    def _db_put(self, kind: str, domain: str, expires: float, value: str):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO domain_cache (kind, domain, expires, value) VALUES (?, ?, ?, ?)",
+                (kind, domain, expires, value)
+            )
+            self._db.commit()
+    
+    async def get(self, kind: str, domain: str):
+        domain = normalize_domain(domain)
+        key = (kind, domain)
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return dict(entry[1])
+            del self._entries[key]
+            self.stats["expired"] += 1
+        
+        if self._db is not None:
+            # SQLite access runs in a worker thread to keep the event loop free
+            row = await asyncio.get_event_loop().run_in_executor(None, self._db_get, kind, domain)
+            if row is not None and row[0] > now:
+                value = json.loads(row[1])
+                self._remember(key, row[0], value)
+                self.stats["hits"] += 1
+                self.stats["sqlite_hits"] += 1
+                return dict(value)
+        
+        self.stats["misses"] += 1
+        return None
+    
+    async def put(self, kind: str, domain: str, value: Dict[str, Any], ttl: float):
+        if ttl <= 0:
+            return
+        domain = normalize_domain(domain)
+        expires = time.time() + ttl
+        self._remember((kind, domain), expires, dict(value))
+        if self._db is not None:
+            await asyncio.get_event_loop().run_in_executor(
+                None, self._db_put, kind, domain, expires, json.dumps(value, default=str)
+            )
+    
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "whois_ttl_seconds": self.whois_ttl,
+            "negative_ttl_seconds": self.negative_ttl,
+            "sqlite": bool(self._db)
+        }
+
+class DomainChecker:
+    """Domain availability checker with multiple verification methods
+    
+    This class encapsulates the core domain checking logic that will be
+    exposed through MCP tools. It uses both WHOIS and DNS resolution
+    to determine if a domain is likely available for registration.
+    """
+    
+    def __init__(self):
+        # DNS resolvers are created by _setup_dns() on the first lookup
+        self.dns_resolver = None
+        self.dns_mode = DNS_MODE
+        self._dns_semaphore = asyncio.Semaphore(DNS_CONCURRENCY)
+        self._async_resolvers = []
+        self._next_resolver = 0
+        
+        # Lookup cache shared by all tools (memory LRU + optional SQLite tier)
+        self.cache = DomainCache()
+        
+        # Optional local index of registered names, consulted before any network lookup
+        self.index = DomainIndex(DOMAIN_INDEX_PATH) if DOMAIN_INDEX_PATH else None
+        
+        # Direct WHOIS/RDAP client with a pooled HTTP connection for RDAP registries
+        self.whois_client = None
+        if WHOIS_CLIENT == "native":
+            rdap_servers = {**RDAP_SERVERS, **RDAP_SERVER_OVERRIDES}
+            for tld in WHOIS_SERVER_OVERRIDES:
+                if tld not in RDAP_SERVER_OVERRIDES:
+                    rdap_servers.pop(tld, None)
+            self.whois_client = WhoisClient(
+                rdap_servers=rdap_servers,
+                whois_servers={**WHOIS_SERVERS, **WHOIS_SERVER_OVERRIDES},
+                timeout=WHOIS_TIMEOUT,
+                per_server_concurrency=WHOIS_SERVER_CONCURRENCY
+            )
+        
+        # Batch engine state: one semaphore per TLD, created on first use
+        self.batch_concurrency = DOMAIN_BATCH_CONCURRENCY
+        self.tld_concurrency = DOMAIN_TLD_CONCURRENCY
+        self._tld_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    @staticmethod
+    def deduplicate(domains: List[str]) -> List[str]:
+        """Normalize (trim, lowercase, drop trailing dot) and drop repeated domains, keeping order"""
+        seen = set()
+        unique = []
+        for domain in domains:
+            normalized = normalize_domain(domain)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                unique.append(normalized)
+        return unique
+    
+    @staticmethod
+    def generate_candidates(seeds: List[str], tlds: List[str], max_candidates: int = 200) -> List[str]:
+        """Build candidate domains from seed words, most natural names first
+        
+        Labels are generated in order of preference: the bare seeds, seed
+        pairs (joined and hyphenated), then prefixed and suffixed variants.
+        Each label is combined with every TLD before moving on, so the best
+        names are checked first and survive the max_candidates cut.
+        """
+        words = []
+        for seed in seeds:
+            word = re.sub(r"[^a-z0-9-]", "", seed.strip().lower().replace(" ", "-")).strip("-")
+            if word and word not in words:
+                words.append(word)
+        
+        labels = list(words)
+        for first in words:
+            for second in words:
+                if first != second:
+                    labels += [first + second, f"{first}-{second}"]
+        for word in words:
+            labels += [prefix + word for prefix in NAME_PREFIXES]
+            labels += [word + suffix for suffix in NAME_SUFFIXES]
+            labels += [f"{prefix}-{word}" for prefix in NAME_PREFIXES]
+            labels += [f"{word}-{suffix}" for suffix in NAME_SUFFIXES]
+        
+        tlds = [tld.strip().lower().lstrip(".") for tld in tlds if tld.strip()]
+        candidates = [
+            f"{label}.{tld}" for label in labels if _LABEL_PATTERN.match(label) for tld in tlds
+        ]
+        return DomainChecker.deduplicate(candidates)[:max_candidates]
+    
+    def _setup_dns(self):
+        """Import dnspython and build the resolvers (once, on the first DNS lookup)"""
+        if self.dns_resolver is not None:
+            return
+        _import_dns()
+        
+        # Configure DNS resolver with reasonable timeouts
+        # These settings prevent the MCP server from hanging on slow DNS queries
+        resolver = dns.resolver.Resolver()
+        resolver.timeout = 5
+        resolver.lifetime = 10
+        if DNS_NAMESERVERS:
+            resolver.nameservers = DNS_NAMESERVERS
+        resolver.port = DNS_PORT
+        
+        # Async mode: one event-loop resolver per nameserver, each behind its own
+        # rate limiter, plus a global cap on queries in flight. Thousands of lookups
+        # can be pending without occupying a thread each.
+        for nameserver in resolver.nameservers:
+            async_resolver = dns.asyncresolver.Resolver(configure=False)
+            async_resolver.nameservers = [nameserver]
+            async_resolver.timeout = resolver.timeout
+            async_resolver.lifetime = resolver.lifetime
+            async_resolver.port = DNS_PORT
+            self._async_resolvers.append((async_resolver, RateLimiter(DNS_RATE_PER_NAMESERVER)))
+        self.dns_resolver = resolver
+    
+    def _index_result(self, domain: str):
+        """Answer from the local index, or None if the network has to decide
+        
+        A listed name is registered. An unlisted name only counts as
+        available in offline mode, since zone files omit registered domains
+        without nameservers (e.g. on hold).
+        """
+        domain = normalize_domain(domain)
+        if self.index is None or not self.index.covers(domain):
+            return None
+        if domain in self.index:
+            available, reason = False, "Listed in registered-domain index"
+        elif DOMAIN_INDEX_OFFLINE:
+            available, reason = True, "Not listed in registered-domain index (offline mode)"
+        else:
+            return None
+        return {
+            "domain": domain,
+            "available": available,
+            "whois_available": None,
+            "dns_resolvable": None,
+            "error": None,
+            "details": {"index": {"registered": not available, "reason": reason}}
+        }
+    
+    @staticmethod
+    def _is_throttled(result: Dict[str, Any]) -> bool:
+        whois_result = result.get("details", {}).get("whois", {})
+        if whois_result.get("available") is not None:
+            return False
+        return bool(_THROTTLE_PATTERN.search(str(whois_result.get("reason", ""))))
+    
+    async def _check_with_retry(self, domain: str, verdict_only: bool) -> Dict[str, Any]:
+        """Check one domain under its TLD limit, retrying throttled WHOIS answers with backoff"""
+        return await self._retry_throttled(domain, lambda: self.check_domain_availability(domain, verdict_only))
+    
+    async def _retry_throttled(self, domain: str, check) -> Dict[str, Any]:
+        """Run check() under the domain's TLD limit, retrying throttled WHOIS answers with backoff
+        
+        check must return a result shaped like check_domain_availability().
+        """
+        tld = domain.rsplit(".", 1)[-1]
+        semaphore = self._tld_semaphores.setdefault(tld, asyncio.Semaphore(self.tld_concurrency))
+        
+        for attempt in range(WHOIS_MAX_RETRIES + 1):
+            async with semaphore:
+                try:
+                    result = await check()
+                except Exception as e:
+                    result = {"domain": domain, "available": None, "error": str(e)}
+            
+            if attempt == WHOIS_MAX_RETRIES or not self._is_throttled(result):
+                if attempt:
+                    result["retries"] = attempt
+                return result
+            
+            # Exponential backoff with jitter, outside the TLD semaphore so other domains proceed
+            await asyncio.sleep(WHOIS_RETRY_BACKOFF * (2 ** attempt) * (0.5 + random.random()))
+    
+    async def check_domains_stream(self, domains: List[str], verdict_only: bool = False):
+        """Check many domains with bounded concurrency, yielding (index, result) as each finishes
+        
+        A fixed pool of workers pulls from the input list, so only
+        batch_concurrency checks (and their tasks) exist at any time,
+        regardless of how many domains are queued.
+        """
+        if not domains:
+            return
+        
+        work: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(domains):
+            work.put_nowait(item)
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def worker():
+            while True:
+                try:
+                    index, domain = work.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                result = await self._check_with_retry(domain, verdict_only)
+                await finished.put((index, result))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.batch_concurrency, len(domains)))]
+        try:
+            for _ in range(len(domains)):
+                yield await finished.get()
+        finally:
+            for task in workers:
+                task.cancel()
+    
+    async def sweep_stream(self, candidates: List[str]):
+        """Check candidate names in a two-stage pipeline, yielding results as they finish
+        
+        Stage 1 resolves every candidate (cheap, cached, rate limited); a
+        name that resolves is registered and never reaches WHOIS. Stage 2
+        runs WHOIS only on the survivors with batch_concurrency workers,
+        fed through a bounded queue: DNS stays just far enough ahead to keep
+        the WHOIS workers busy without resolving the whole list up front.
+        """
+        if not candidates:
+            return
+        
+        dns_work: asyncio.Queue = asyncio.Queue()
+        for domain in candidates:
+            dns_work.put_nowait(domain)
+        whois_work: asyncio.Queue = asyncio.Queue(maxsize=self.batch_concurrency * 2)
+        finished: asyncio.Queue = asyncio.Queue()
+        
+        async def dns_worker():
+            while True:
+                try:
+                    domain = dns_work.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                # Every candidate must reach `finished`, or the consumer waits forever
+                try:
+                    indexed = self._index_result(domain)
+                    if indexed is not None:
+                        await finished.put(indexed)
+                        continue
+                    dns_result = await self._check_dns_resolution(domain)
+                except Exception as e:
+                    await finished.put({"domain": domain, "available": None, "error": str(e)})
+                    continue
+                if dns_result["resolvable"] is True:
+                    await finished.put({
+                        "domain": domain,
+                        "available": False,
+                        "whois_available": None,
+                        "dns_resolvable": True,
+                        "error": None,
+                        "details": {"whois": {"reason": "Skipped: domain resolves"}, "dns": dns_result}
+                    })
+                else:
+                    await whois_work.put((domain, dns_result))
+        
+        async def whois_check(domain: str, dns_result: Dict[str, Any]) -> Dict[str, Any]:
+            whois_result = await self._check_whois(domain)
+            available = None
+            if whois_result["available"] is True and dns_result["resolvable"] is False:
+                available = True
+            elif whois_result["available"] is False:
+                available = False
+            return {
+                "domain": domain,
+                "available": available,
+                "whois_available": whois_result["available"],
+                "dns_resolvable": dns_result["resolvable"],
+                "error": None,
+                "details": {"whois": whois_result, "dns": dns_result}
+            }
+        
+        async def whois_worker():
+            while True:
+                domain, dns_result = await whois_work.get()
+                try:
+                    result = await self._retry_throttled(domain, lambda: whois_check(domain, dns_result))
+                except Exception as e:
+                    result = {"domain": domain, "available": None, "error": str(e)}
+                await finished.put(result)
+        
+        workers = [asyncio.create_task(dns_worker()) for _ in range(min(SWEEP_DNS_CONCURRENCY, len(candidates)))]
+        workers += [asyncio.create_task(whois_worker()) for _ in range(min(self.batch_concurrency, len(candidates)))]
+        try:
+            for _ in range(len(candidates)):
+                yield await finished.get()
+        finally:
+            for task in workers:
+                task.cancel()
+    
+    async def check_domain_availability(self, domain: str, verdict_only: bool = False) -> Dict[str, Any]:
+        """Check if a domain is available using multiple methods
+        
+        This is the main async method that coordinates domain checking.
+        MCP tools must be async to avoid blocking the server.
+        
+        WHOIS and DNS run concurrently, so latency is the slower of the two
+        lookups instead of their sum. With verdict_only=True the check stops
+        as soon as one probe settles the answer: a resolving A record or a
+        WHOIS registration means "taken" and the other probe is cancelled.
+        """
+        # A local index hit answers without any network lookup
+        indexed = self._index_result(domain)
+        if indexed is not None:
+            return indexed
+        
+        # Initialize result structure with all possible fields
+        results = {
+            "domain": domain,
+            "available": None,
+            "whois_available": None,
+            "dns_resolvable": None,
+            "error": None,
+            "details": {}
+        }
+        
+        # Method 1: WHOIS lookup (checks domain registration records)
+        # Method 2: DNS resolution check (checks if domain resolves to IP)
+        whois_task = asyncio.create_task(self._check_whois(domain))
+        dns_task = asyncio.create_task(self._check_dns_resolution(domain))
+        pending = {whois_task, dns_task}
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                if whois_task in done:
+                    whois_result = whois_task.result()
+                    results["whois_available"] = whois_result["available"]
+                    results["details"]["whois"] = whois_result
+                if dns_task in done:
+                    dns_result = dns_task.result()
+                    results["dns_resolvable"] = dns_result["resolvable"]
+                    results["details"]["dns"] = dns_result
+                
+                # Short-circuit: either probe alone can prove the domain is taken
+                if verdict_only and pending and (
+                    results["whois_available"] is False or results["dns_resolvable"] is True
+                ):
+                    for task in pending:
+                        task.cancel()
+                    skipped = "whois" if whois_task in pending else "dns"
+                    results["details"][skipped] = {"reason": "Skipped: verdict already known"}
+                    pending = set()
+            
+            # Keep the report order stable regardless of which probe finished first
+            results["details"] = {
+                key: results["details"][key] for key in ("whois", "dns") if key in results["details"]
+            }
+            
+            # Determine overall availability using both methods
+            # A domain is likely available if WHOIS shows it's free AND it doesn't resolve
+            if results["whois_available"] is True and results["dns_resolvable"] is False:
+                results["available"] = True
+            elif results["whois_available"] is False:
+                results["available"] = False
+            elif verdict_only and results["dns_resolvable"] is True:
+                # A domain that resolves is registered, even without WHOIS confirmation
+                results["available"] = False
+            else:
+                results["available"] = None
+                
+        except Exception as e:
+            for task in pending:
+                task.cancel()
+            results["error"] = str(e)
+            logger.error(f"Error checking domain {domain}: {e}")
+        
+        return results
+    
+    async def _check_whois(self, domain: str) -> Dict[str, Any]:
+        """Check domain availability using WHOIS, served from the cache for WHOIS_CACHE_TTL
+        
+        "No match" answers use the shorter negative TTL so freshly registered
+        names are noticed quickly. Unclear or failed lookups are not cached.
+        """
+        cached = await self.cache.get("whois", domain)
+        if cached is not None:
+            return cached
+        
+        result = await self._lookup_whois(domain)
+        if result["available"] is False:
+            await self.cache.put("whois", domain, result, self.cache.whois_ttl)
+        elif result["available"] is True:
+            await self.cache.put("whois", domain, result, self.cache.negative_ttl)
+        return result
+    
+    async def _lookup_whois(self, domain: str) -> Dict[str, Any]:
+        """Look up the domain's WHOIS record
+        
+        Known TLDs go through the native client (RDAP or a direct port-43
+        query). Everything else uses python-whois, which is a synchronous
+        operation, so we use run_in_executor to make it async-compatible.
+        Without python-whois the lookup is reported as unclear, not raised.
+        """
+        if self.whois_client is not None:
+            try:
+                result = await self.whois_client.lookup(domain)
+                if result is not None:
+                    return result
+            except Exception as e:
+                return {"available": None, "reason": f"WHOIS lookup failed: {str(e)}"}
+        
+        try:
+            _import_whois()
+        except ImportError as e:
+            # Reported as an unclear WHOIS answer so the DNS evidence still counts
+            return {"available": None, "reason": f"WHOIS unavailable: {str(e)}"}
+        
+        try:
+            loop = asyncio.get_event_loop()
+            # Run the blocking WHOIS lookup in a thread pool to keep the MCP server responsive
+            whois_data = await loop.run_in_executor(None, whois.whois, domain)
+            
+            if whois_data is None:
+                return {"available": True, "reason": "No WHOIS data found"}
+            
+            if hasattr(whois_data, 'status') and whois_data.status:
+                return {
+                    "available": False, 
+                    "reason": "Domain has active status",
+                    "status": whois_data.status,
+                    "registrar": getattr(whois_data, 'registrar', None),
+                    "creation_date": str(getattr(whois_data, 'creation_date', None))
+                }
+            
+            if hasattr(whois_data, 'registrar') and whois_data.registrar:
+                return {
+                    "available": False,
+                    "reason": "Domain has registrar",
+                    "registrar": whois_data.registrar
+                }
+            
+            return {
+                "available": None,
+                "reason": "WHOIS data exists but unclear status",
+                "raw_data": str(whois_data)[:500]
+            }
+            
+        except whois.parser.PywhoisError as e:
+            return {"available": True, "reason": f"WHOIS parser error: {str(e)}"}
+        except Exception as e:
+            return {"available": None, "reason": f"WHOIS lookup failed: {str(e)}"}
+    
+    async def _resolve_a_async(self, domain: str):
+        """Resolve A records on the event loop, honouring concurrency and rate limits
+        
+        Nameservers are used round-robin; each query waits for a token from
+        its nameserver's bucket before it is sent.
+        Returns (records, ttl), or (None, None) for NXDOMAIN.
+        """
+        async with self._dns_semaphore:
+            resolver, limiter = self._async_resolvers[self._next_resolver % len(self._async_resolvers)]
+            self._next_resolver += 1
+            await limiter.acquire()
+            try:
+                answers = await resolver.resolve(domain, 'A')
+                return [str(answer) for answer in answers], answers.rrset.ttl
+            except dns.resolver.NXDOMAIN:
+                return None, None
+    
+    async def _check_dns_resolution(self, domain: str) -> Dict[str, Any]:
+        """Check if domain resolves via DNS, served from the cache while the record TTL lasts
+        
+        Positive answers are cached for the TTL of the A record set (not at
+        all for TTL 0), NXDOMAIN for the shorter negative TTL. Failed lookups are not cached.
+        """
+        cached = await self.cache.get("dns", domain)
+        if cached is not None:
+            return cached
+        
+        result = await self._lookup_dns(domain)
+        if result["resolvable"] is True:
+            # TTL 0 means "do not cache"; only a missing TTL falls back to the negative TTL
+            ttl = result.get("ttl")
+            if ttl is None:
+                ttl = self.cache.negative_ttl
+            if ttl > 0:
+                await self.cache.put("dns", domain, result, ttl)
+        elif result["resolvable"] is False:
+            await self.cache.put("dns", domain, result, self.cache.negative_ttl)
+        return result
+    
+    async def _lookup_dns(self, domain: str) -> Dict[str, Any]:
+        """Resolve the domain's A records
+        
+        In "async" mode the query runs natively on the event loop. In "thread"
+        mode the synchronous resolver is wrapped in run_in_executor to
+        maintain async compatibility for the MCP server.
+        """
+        try:
+            self._setup_dns()
+            if self.dns_mode == "async" and self._async_resolvers:
+                a_records, ttl = await self._resolve_a_async(domain)
+            else:
+                loop = asyncio.get_event_loop()
+                
+                def resolve_dns():
+                    """Helper function to resolve DNS in thread pool"""
+                    try:
+                        answers = self.dns_resolver.resolve(domain, 'A')
+                        return [str(answer) for answer in answers], answers.rrset.ttl
+                    except dns.resolver.NXDOMAIN:
+                        return None, None
+                
+                # Run DNS resolution in thread pool to avoid blocking the MCP server
+                a_records, ttl = await loop.run_in_executor(None, resolve_dns)
+            
+            if a_records:
+                return {
+                    "resolvable": True,
+                    "a_records": a_records,
+                    "ttl": ttl,
+                    "reason": "Domain resolves to IP addresses"
+                }
+            else:
+                return {
+                    "resolvable": False,
+                    "reason": "Domain does not resolve (NXDOMAIN)"
+                }
+                
+        except Exception as e:
+            return {
+                "resolvable": None,
+                "reason": f"DNS lookup failed: {str(e)}"
+            }
+
+# Initialize domain checker instance
+# This will be used by all MCP tools
+domain_checker = DomainChecker()
+
+# MCP TOOLS
+# Tools are functions that MCP clients can call to perform actions
+# They must be decorated with @mcp.tool() and should be async
+
+def _status_label(available) -> str:
+    """Human-readable status for an availability verdict (True/False/None)"""
+    if available is True:
+        return "✅ LIKELY AVAILABLE"
+    elif available is False:
+        return "❌ NOT AVAILABLE"
+    return "❓ UNCLEAR"
+
+# Response formats: human-readable table, or machine-readable compact JSON / NDJSON
+OUTPUT_FORMATS = ("table", "json-compact", "ndjson")
+
+def _public_result(result: Dict[str, Any], include_raw: bool) -> Dict[str, Any]:
+    """The result as returned to clients: the WHOIS raw dump is only kept on request"""
+    whois_details = result.get("details", {}).get("whois")
+    if include_raw or not whois_details or "raw_data" not in whois_details:
+        return result
+    details = dict(result["details"])
+    details["whois"] = {key: value for key, value in whois_details.items() if key != "raw_data"}
+    return {**result, "details": details}
+
+def _machine_record(result: Dict[str, Any], details: bool) -> Dict[str, Any]:
+    """Verdict-only record for the JSON formats; the probe details only on request
+    
+    Unclear verdicts keep the WHOIS reason so callers can tell a
+    throttled lookup from an ambiguous record.
+    """
+    if details:
+        return result
+    record = {
+        "domain": result["domain"],
+        "available": result["available"],
+        "whois": result.get("whois_available"),
+        "dns": result.get("dns_resolvable")
+    }
+    if result["available"] is None:
+        reason = result.get("details", {}).get("whois", {}).get("reason")
+        if reason:
+            record["reason"] = reason
+    if result.get("error"):
+        record["error"] = result["error"]
+    if result.get("retries"):
+        record["retries"] = result["retries"]
+    return record
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+@mcp.tool()
+async def check_domain(domain: str, verdict_only: bool = False, output: str = "table",
+                       details: bool = False, include_raw: bool = False) -> str:
+    """Check if a single domain name is available for registration
+    
+    This is an MCP tool that can be called by clients like Claude Desktop.
+    It returns a formatted string response for easy reading, or with
+    output="json-compact" / "ndjson" a single compact JSON verdict
+    (with the WHOIS/DNS details only if details=True).
+    Set verdict_only=True to stop as soon as the domain is known to be taken.
+    Set include_raw=True to include the raw WHOIS text for unclear answers.
+    """
+    if output not in OUTPUT_FORMATS:
+        return f"Error: output must be one of {', '.join(OUTPUT_FORMATS)}"
+    
+    domain = normalize_domain(domain)
+    result = _public_result(await domain_checker.check_domain_availability(domain, verdict_only), include_raw)
+    if output != "table":
+        return _compact_json(_machine_record(result, details))
+    
+    # Format the response nicely
+    status = _status_label(result["available"])
+    
+    response = f"""Domain: {domain}
+Status: {status}
+
+WHOIS Check: {'Available' if result['whois_available'] else 'Registered' if result['whois_available'] is False else 'Unclear' if 'whois' in result['details'] else 'Not checked'}
+DNS Resolution: {'Not resolving' if result['dns_resolvable'] is False else 'Resolving' if result['dns_resolvable'] else 'Error' if 'dns' in result['details'] else 'Not checked'}
+
+Details:
+{json.dumps(result['details'], indent=2)}
+"""
+    
+    if result["error"]:
+        response += f"\nError: {result['error']}"
+    
+    return response
+
+@mcp.tool()
+async def check_multiple_domains(domains: List[str], verdict_only: bool = False, output: str = "table",
+                                 details: bool = False, include_raw: bool = False, ctx: Context = None) -> str:
+    """Check availability for multiple domain names at once
+    
+    Duplicates are removed and the batch runs with bounded concurrency
+    (globally and per TLD), retrying throttled WHOIS lookups with backoff.
+    Each finished domain is streamed to the client as a progress
+    notification, so large sweeps show first results within seconds.
+    Set verdict_only=True to skip the remaining lookup once a domain is known to be taken.
+    
+    Output formats:
+    - "table": one status line per domain (default); with details=True each
+      line is followed by the domain's compact JSON result
+    - "json-compact": one compact JSON array of verdicts
+    - "ndjson": one compact JSON verdict per line; each line is also
+      streamed as the domain's progress message
+    The JSON formats carry the WHOIS/DNS details only with details=True.
+    The raw WHOIS text of unclear answers is only included with include_raw=True.
+    Each result is rendered to its output line as it finishes, so only
+    the formatted lines are kept, not the full result dicts.
+    """
+    if not domains:
+        return "Error: Domain list is required"
+    if output not in OUTPUT_FORMATS:
+        return f"Error: output must be one of {', '.join(OUTPUT_FORMATS)}"
+    
+    unique_domains = DomainChecker.deduplicate(domains)
+    rows = [None] * len(unique_domains)
+    completed = 0
+    
+    async for index, result in domain_checker.check_domains_stream(unique_domains, verdict_only):
+        result = _public_result(result, include_raw)
+        if output == "table":
+            rows[index] = f"{result['domain']:<30} {_status_label(result['available'])}"
+            if details:
+                rows[index] += f"\n    {_compact_json(result)}"
+        else:
+            rows[index] = _compact_json(_machine_record(result, details))
+        completed += 1
+        if ctx is not None:
+            await ctx.report_progress(progress=completed, total=len(unique_domains))
+            if output == "ndjson":
+                await ctx.info(rows[index])
+            else:
+                await ctx.info(f"{result['domain']}: {_status_label(result['available'])}")
+    
+    if output == "json-compact":
+        return "[" + ",".join(rows) + "]"
+    if output == "ndjson":
+        return "\n".join(rows)
+    
+    # Format results as a table
+    response = "Domain Availability Check Results:\n\n" + "\n".join(rows) + "\n"
+    
+    if len(unique_domains) < len(domains):
+        response += f"\n({len(domains) - len(unique_domains)} duplicate domains skipped)\n"
+    
+    return response
+
+@mcp.tool()
+async def suggest_domains(seeds: List[str], tlds: List[str] = None, limit: int = 20,
+                          max_candidates: int = 200, ctx: Context = None) -> str:
+    """Find available domain names built from seed words
+    
+    Candidates are generated from the seeds (pairs, hyphenation, common
+    prefixes/suffixes) across the given TLDs (default: com, net, org, io,
+    dev, app). Names that resolve in DNS are discarded without a WHOIS
+    lookup; the rest are checked via WHOIS. Returns the best `limit`
+    available names, shortest and unhyphenated first, in TLD order.
+    """
+    if not seeds:
+        return "Error: At least one seed word is required"
+    
+    tlds = tlds or SWEEP_DEFAULT_TLDS
+    candidates = DomainChecker.generate_candidates(seeds, tlds, max_candidates)
+    if not candidates:
+        return "Error: No valid domain names could be generated from the seeds"
+    
+    # Ranking inputs: position in the generated list and TLD preference
+    generated_order = {domain: index for index, domain in enumerate(candidates)}
+    tld_order = {tld.strip().lower().lstrip("."): index for index, tld in enumerate(tlds)}
+    results = []
+    prefiltered = 0
+    
+    async for result in domain_checker.sweep_stream(candidates):
+        results.append(result)
+        details = result.get("details", {})
+        if "index" in details or details.get("whois", {}).get("reason") == "Skipped: domain resolves":
+            prefiltered += 1
+        if ctx is not None:
+            await ctx.report_progress(progress=len(results), total=len(candidates))
+            if result["available"] is True:
+                await ctx.info(f"{result['domain']}: {_status_label(True)}")
+    
+    def rank(result):
+        label, _, tld = result["domain"].rpartition(".")
+        return ("-" in label, len(label), tld_order.get(tld, len(tld_order)), generated_order[result["domain"]])
+    
+    available = sorted((r for r in results if r["available"] is True), key=rank)
+    unclear = sorted((r for r in results if r["available"] is None), key=rank)
+    
+    response = f"Domain Suggestions for: {', '.join(seeds)}\n\n"
+    response += f"Candidates checked: {len(candidates)} ({prefiltered} settled by index/DNS, skipped WHOIS)\n"
+    response += f"Likely available: {len(available)}\n\n"
+    for result in available[:limit]:
+        response += f"{result['domain']:<30} {_status_label(True)}\n"
+    if not available:
+        response += "No available names found - try other seeds or TLDs.\n"
+    if unclear:
+        response += f"\nUnclear (WHOIS inconclusive): {', '.join(r['domain'] for r in unclear[:limit])}\n"
+    
+    return response
+
+# MCP RESOURCES
+# Resources are data that can be accessed by MCP clients using URIs
+# They provide a way to expose structured data through the MCP protocol
+
+@mcp.resource("domain://check/{domain}")
+async def domain_info_resource(domain: str) -> str:
+    """Get domain availability information as a resource
+    
+    This MCP resource allows clients to access domain data using a URI like:
+    domain://check/example.com
+    
+    Resources return raw data (JSON) rather than formatted strings.
+    """
+    result = await domain_checker.check_domain_availability(normalize_domain(domain))
+    return json.dumps(result, indent=2)
+
+@mcp.resource("domain://stats")
+async def domain_stats_resource() -> str:
+    """Cache statistics for WHOIS and DNS lookups (hits, misses, evictions) and the loaded domain index"""
+    return json.dumps({
+        "cache": domain_checker.cache.snapshot(),
+        "index": domain_checker.index.snapshot() if domain_checker.index else None
+    }, indent=2)
+
+# MCP SERVER STARTUP
+# This section configures and starts the MCP server
+def main(argv: List[str] = None):
+    """Run the MCP server with the transport selected on the command line"""
+    parser = argparse.ArgumentParser(description="Domain Checker MCP server")
+    parser.add_argument("--transport", choices=["stdio", "streamable-http", "sse"],
+                        default=os.environ.get("MCP_TRANSPORT", "stdio"),
+                        help="stdio for local MCP clients, streamable-http for remote deployment")
+    # Host 0.0.0.0 accepts connections from any IP (needed for remote deployment);
+    # PORT is set by deployment platforms like DigitalOcean
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8080)))
+    parser.add_argument("--log-level", default="debug")
+    args = parser.parse_args(argv)
+    
+    if args.transport == "stdio":
+        mcp.run()
+    else:
+        mcp.run(transport=args.transport, host=args.host, port=args.port, log_level=args.log_level)
+
+if __name__ == "__main__":
+    main()
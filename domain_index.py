@@ -0,0 +1,230 @@
+"""
+Registered-domain index for offline existence checks
+
+Built once from a TLD zone file or a bulk list of registered domains:
+- <index>        sorted, de-duplicated names, one per line (memory-mapped, binary search)
+- <index>.bloom  Bloom filter over the same names plus the TLDs it covers
+
+Lookups hit the Bloom filter first, so most unknown names are rejected
+without touching the sorted file; a filter hit is confirmed exactly.
+
+Build an index:
+    python domain_index.py com.zone registered.idx
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional
+
+# Names sorted in memory per run before they are merged from temporary files
+SORT_CHUNK_SIZE = 1_000_000
+
+
+class BloomFilter:
+    """Bit-array Bloom filter using double hashing over one BLAKE2b digest"""
+
+    def __init__(self, bits: int, hashes: int, data: Optional[bytearray] = None):
+        self.bits = bits
+        self.hashes = hashes
+        self.data = data if data is not None else bytearray((bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.001) -> "BloomFilter":
+        capacity = max(1, capacity)
+        bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        return cls(bits, hashes)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.data[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def parse_names(lines: Iterable[str]) -> Iterator[str]:
+    """Registered names from a zone file or a plain one-domain-per-line list
+
+    Zone files contribute the owner names of NS records (the delegations),
+    resolving relative names against $ORIGIN; the zone apex ("@" or the
+    origin itself), empty owners and glue records are skipped. Plain lists
+    are taken as they are.
+
+    >>> zone = ["$ORIGIN com.", "@ 86400 IN NS a.gtld-servers.net.",
+    ...         "com. 86400 IN NS b.gtld-servers.net.", ". IN NS x.",
+    ...         "example 172800 IN NS ns1.example.com.", "ns1.example 172800 IN A 192.0.2.1"]
+    >>> list(parse_names(zone))
+    ['example.com']
+    """
+    origin = ""
+    for line in lines:
+        line = line.split(";", 1)[0].rstrip()
+        if not line or line[0].isspace():
+            continue
+        fields = line.split()
+        if fields[0].upper() == "$ORIGIN" and len(fields) > 1:
+            origin = fields[1].lower().rstrip(".")
+            continue
+        if fields[0].startswith("$"):
+            continue
+
+        name = fields[0].lower()
+        if len(fields) > 1:
+            # Zone record: owner [ttl] [class] type rdata
+            types = [field.upper() for field in fields[1:4]]
+            if "NS" not in types or name == "@":
+                continue
+            if not name.endswith(".") and origin:
+                name = f"{name}.{origin}"
+        name = name.rstrip(".")
+        if "." in name and name != origin:
+            yield name
+
+
+def normalize(domain: str) -> str:
+    """Lookup form of a domain: trimmed, lowercase, without trailing dot, as stored in the index"""
+    return domain.strip().lower().rstrip(".")
+
+
+def _sorted_runs(names: Iterable[str], directory: str) -> List[str]:
+    """Write names as sorted runs of SORT_CHUNK_SIZE to temporary files"""
+    runs = []
+    chunk: List[str] = []
+
+    def flush():
+        chunk.sort()
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".run") as run:
+            run.writelines(f"{name}\n" for name in chunk)
+            runs.append(run.name)
+        chunk.clear()
+
+    for name in names:
+        chunk.append(name)
+        if len(chunk) >= SORT_CHUNK_SIZE:
+            flush()
+    if chunk:
+        flush()
+    return runs
+
+
+def build_index(source_path: str, index_path: str, error_rate: float = 0.001) -> int:
+    """Build <index_path> and <index_path>.bloom from a zone file or domain list
+
+    Sorts externally (sorted runs merged with heapq), so zone files larger
+    than memory can be indexed. Returns the number of unique names.
+    """
+    directory = os.path.dirname(os.path.abspath(index_path))
+    with open(source_path, encoding="utf-8", errors="replace") as source:
+        runs = _sorted_runs(parse_names(source), directory)
+
+    try:
+        total = 0
+        for run in runs:
+            with open(run, "rb") as f:
+                total += sum(1 for _ in f)
+
+        bloom = BloomFilter.for_capacity(total, error_rate)
+        tlds = set()
+        count = 0
+        previous = None
+        files = [open(run, encoding="utf-8") for run in runs]
+        try:
+            with open(index_path + ".tmp", "w", encoding="utf-8") as out:
+                for line in heapq.merge(*files):
+                    name = line.rstrip("\n")
+                    if name == previous:
+                        continue
+                    previous = name
+                    out.write(line)
+                    bloom.add(name)
+                    tlds.add(name.rsplit(".", 1)[-1])
+                    count += 1
+        finally:
+            for f in files:
+                f.close()
+    finally:
+        for run in runs:
+            os.remove(run)
+
+    header = {"bits": bloom.bits, "hashes": bloom.hashes, "count": count, "tlds": sorted(tlds)}
+    with open(index_path + ".bloom.tmp", "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        f.write(bloom.data)
+    os.replace(index_path + ".tmp", index_path)
+    os.replace(index_path + ".bloom.tmp", index_path + ".bloom")
+    return count
+
+
+class DomainIndex:
+    """Read side of an index built by build_index()"""
+
+    def __init__(self, index_path: str):
+        self.path = index_path
+        with open(index_path + ".bloom", "rb") as f:
+            header = json.loads(f.readline())
+            self.bloom = BloomFilter(header["bits"], header["hashes"], bytearray(f.read()))
+        self.count = header["count"]
+        self.tlds = set(header["tlds"])
+
+        self._file = open(index_path, "rb")
+        # mmap cannot map empty files
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def covers(self, domain: str) -> bool:
+        """True if the index was built from data for this domain's TLD"""
+        return normalize(domain).rsplit(".", 1)[-1] in self.tlds
+
+    def _search(self, name: bytes) -> bool:
+        # Binary search over byte offsets, snapping each probe to its line start
+        data = self._mmap
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b"\n", 0, mid) + 1
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+            line = data[start:end]
+            if line == name:
+                return True
+            if line < name:
+                lo = end + 1
+            else:
+                hi = start
+        return False
+
+    def __contains__(self, domain: str) -> bool:
+        domain = normalize(domain)
+        if self._mmap is None or domain not in self.bloom:
+            return False
+        return self._search(domain.encode("utf-8"))
+
+    def snapshot(self):
+        return {"path": self.path, "names": self.count, "tlds": sorted(self.tlds)}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python domain_index.py <zone-file-or-list> <index-path>")
+        sys.exit(1)
+    names = build_index(sys.argv[1], sys.argv[2])
+    print(f"Indexed {names} registered names into {sys.argv[2]}")
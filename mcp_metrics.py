@@ -0,0 +1,258 @@
+"""
+MCP Server Metrics
+Latenz-Histogramme, In-Flight-Gauges und Fehlerzähler pro Tool/Resource
+
+Verwendung:
+    metrics = ServerMetrics("skill-router")
+    metrics.instrument(mcp)          # vor den @mcp.tool() / @mcp.resource() Definitionen
+    metrics.register_endpoints(mcp)  # metrics://server + GET /metrics (Prometheus)
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+
+class LatencyHistogram:
+    """
+    Log-lineares Histogramm (HDR-Stil) für Latenzen in Mikrosekunden
+
+    Pro Zweierpotenz gibt es 2^SUB_BITS Sub-Buckets, d.h. ~3% relative
+    Genauigkeit bei konstantem Aufwand pro Messung und wenigen hundert
+    Buckets über den ganzen Wertebereich.
+    """
+
+    SUB_BITS = 5
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        # Mantisse mit SUB_BITS+1 Bits: die obere Hälfte [2^SUB_BITS, 2^(SUB_BITS+1))
+        # sind die 2^SUB_BITS Sub-Buckets der jeweiligen Zweierpotenz
+        bits = self.SUB_BITS + 1
+        if value < (1 << bits):
+            return value
+        shift = value.bit_length() - bits
+        return (shift << bits) + (value >> shift)
+
+    def _upper_bound(self, index: int) -> int:
+        bits = self.SUB_BITS + 1
+        shift = index >> bits
+        if shift == 0:
+            return index
+        mantissa = index & ((1 << bits) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, micros: int):
+        micros = max(0, int(micros))
+        index = self._index(micros)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def percentile(self, pct: float) -> int:
+        """Obere Bucket-Grenze des pct-Perzentils (0-100) in Mikrosekunden"""
+        if not self.count:
+            return 0
+        target = max(1, round(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+
+class OperationStats:
+    """Zähler für ein einzelnes Tool bzw. eine Resource"""
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+        self.calls = 0
+        self.errors = 0
+        self.inflight = 0
+        self.histogram = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        histogram = self.histogram
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "errors": self.errors,
+            "inflight": self.inflight,
+            "latency_ms": {
+                "mean": round(histogram.total / histogram.count / 1000, 3) if histogram.count else 0.0,
+                "p50": histogram.percentile(50) / 1000,
+                "p95": histogram.percentile(95) / 1000,
+                "p99": histogram.percentile(99) / 1000,
+                "max": histogram.max / 1000
+            }
+        }
+
+
+class ServerMetrics:
+    """Instrumentierung aller Tools und Resources eines FastMCP-Servers"""
+
+    def __init__(self, server_name: str):
+        self.server_name = server_name
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._operations: Dict[tuple, OperationStats] = {}
+
+    def _stats(self, kind: str, name: str) -> OperationStats:
+        key = (kind, name)
+        stats = self._operations.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._operations.setdefault(key, OperationStats(kind, name))
+        return stats
+
+    def wrap(self, kind: str, name: str, fn: Callable) -> Callable:
+        """Umhüllt fn mit Timer, In-Flight-Gauge und Fehlerzähler (Signatur bleibt erhalten)"""
+        stats = self._stats(kind, name)
+        lock = self._lock
+
+        def finish(start: float, failed: bool):
+            elapsed = int((time.perf_counter() - start) * 1_000_000)
+            with lock:
+                stats.inflight -= 1
+                stats.calls += 1
+                if failed:
+                    stats.errors += 1
+                stats.histogram.record(elapsed)
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with lock:
+                    stats.inflight += 1
+                start = time.perf_counter()
+                failed = True
+                try:
+                    result = await fn(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    finish(start, failed)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def sync_wrapper(*args, **kwargs):
+            with lock:
+                stats.inflight += 1
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = fn(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                finish(start, failed)
+
+        return sync_wrapper
+
+    def instrument(self, mcp: Any):
+        """
+        Ersetzt mcp.tool und mcp.resource, sodass jede danach registrierte
+        Funktion automatisch gemessen wird
+        """
+        original_tool = mcp.tool
+        original_resource = mcp.resource
+
+        def tool(*args, **kwargs):
+            # Unterstützt @mcp.tool, @mcp.tool() und @mcp.tool(name=...)
+            if args and callable(args[0]):
+                fn = args[0]
+                return original_tool(self.wrap("tool", kwargs.get("name") or fn.__name__, fn),
+                                     *args[1:], **kwargs)
+
+            decorator = original_tool(*args, **kwargs)
+            explicit = kwargs.get("name") or (args[0] if args and isinstance(args[0], str) else None)
+
+            def apply(fn):
+                return decorator(self.wrap("tool", explicit or fn.__name__, fn))
+            return apply
+
+        def resource(uri, *args, **kwargs):
+            decorator = original_resource(uri, *args, **kwargs)
+
+            def apply(fn):
+                return decorator(self.wrap("resource", uri, fn))
+            return apply
+
+        mcp.tool = tool
+        mcp.resource = resource
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        with self._lock:
+            operations = {
+                stats.name: stats.snapshot()
+                for stats in sorted(self._operations.values(), key=lambda s: (s.kind, s.name))
+            }
+        total_calls = sum(op["calls"] for op in operations.values())
+        return {
+            "server": self.server_name,
+            "uptime_seconds": round(uptime, 1),
+            "total_calls": total_calls,
+            "throughput_per_second": round(total_calls / uptime, 3) if uptime else 0.0,
+            "operations": operations
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus-Textformat: Summary pro Operation plus In-Flight-Gauge und Fehlerzähler"""
+        lines: List[str] = [
+            "# HELP mcp_operation_latency_seconds Latency of MCP tool and resource calls",
+            "# TYPE mcp_operation_latency_seconds summary"
+        ]
+        gauges: List[str] = [
+            "# HELP mcp_operation_inflight Calls currently in progress",
+            "# TYPE mcp_operation_inflight gauge"
+        ]
+        errors: List[str] = [
+            "# HELP mcp_operation_errors_total Calls that raised an exception",
+            "# TYPE mcp_operation_errors_total counter"
+        ]
+
+        with self._lock:
+            operations = sorted(self._operations.values(), key=lambda s: (s.kind, s.name))
+            for stats in operations:
+                name = stats.name.replace("\\", "\\\\").replace('"', '\\"')
+                labels = f'server="{self.server_name}",kind="{stats.kind}",name="{name}"'
+                histogram = stats.histogram
+                for quantile in (0.5, 0.95, 0.99):
+                    value = histogram.percentile(quantile * 100) / 1_000_000
+                    lines.append(f'mcp_operation_latency_seconds{{{labels},quantile="{quantile}"}} {value}')
+                lines.append(f"mcp_operation_latency_seconds_sum{{{labels}}} {histogram.total / 1_000_000}")
+                lines.append(f"mcp_operation_latency_seconds_count{{{labels}}} {histogram.count}")
+                gauges.append(f"mcp_operation_inflight{{{labels}}} {stats.inflight}")
+                errors.append(f"mcp_operation_errors_total{{{labels}}} {stats.errors}")
+
+        return "\n".join(lines + gauges + errors) + "\n"
+
+    def register_endpoints(self, mcp: Any, resource_uri: str = "metrics://server",
+                           http_path: str = "/metrics"):
+        """Registriert die Metrics-Resource und, falls unterstützt, einen HTTP-Endpunkt"""
+
+        @mcp.resource(resource_uri)
+        async def server_metrics() -> str:
+            """Latenz, Durchsatz und Fehler pro Tool/Resource"""
+            return json.dumps(self.snapshot(), indent=2)
+
+        # custom_route gibt es nur bei HTTP-fähigen FastMCP-Versionen
+        if hasattr(mcp, "custom_route"):
+            @mcp.custom_route(http_path, methods=["GET"])
+            async def prometheus_metrics(request):
+                from starlette.responses import PlainTextResponse
+                return PlainTextResponse(self.prometheus(), media_type="text/plain; version=0.0.4")
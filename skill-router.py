@@ -9,12 +9,35 @@ Deployment: DigitalOcean App Platform
 No local installation required!
 """
 
-import asyncio
+import hashlib
+import heapq
+import inspect
 import json
 import logging
+import marshal
+import math
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, get_type_hints
 from fastmcp import FastMCP
+from mcp_metrics import ServerMetrics
+from skill_tools import run_tool_handler
+
+# Optionale Beschleunigung für BM25: NumPy/SciPy werden genutzt, wenn installiert
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,8 +49,15 @@ mcp = FastMCP(
     instructions="Use the skill_router tool to analyze user requests and load only the needed skills. This saves ~90% tokens!"
 )
 
+# Latenz-/Durchsatz-Metriken für alle Tools und Resources
+metrics = ServerMetrics("skill-router")
+metrics.instrument(mcp)
+metrics.register_endpoints(mcp)
+
 # ==================== SKILL DEFINITIONS ====================
 
+# Eingebaute Skills, nur Fallback wenn SKILLS_PATH nicht existiert
+
 SKILLS = [
     {
         "id": "powerpoint",
@@ -169,70 +199,931 @@ SKILLS = [
     }
 ]
 
+# ==================== SKILL CATALOGUE ====================
+
+# Katalog-Quelle: JSON-Datei ({"skills": [...]}) oder Verzeichnis mit *.json Skill-Dateien
+SKILLS_PATH = os.environ.get(
+    "SKILLS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "skill-definitions.json")
+)
+# Binärer Snapshot-Cache, damit der Start das Parsen/Kompilieren überspringt
+# (pro Benutzer, nicht im geteilten Temp-Verzeichnis)
+SKILLS_CACHE_PATH = os.environ.get(
+    "SKILLS_CACHE_PATH",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "skill-router",
+        "catalogue.bin"
+    )
+)
+# Intervall (Sekunden) für die Prüfung auf geänderte Katalog-Dateien, 0 = aus
+SKILLS_RELOAD_INTERVAL = float(os.environ.get("SKILLS_RELOAD_INTERVAL", "5"))
+
+# Bei Änderungen am Snapshot-Format erhöhen
+SNAPSHOT_FORMAT = 2
+
+
+def _normalize_skill(skill: Dict[str, Any]) -> Dict[str, Any]:
+    """Bringt eine Skill-Definition in die interne Form (input_schema -> schema)"""
+    tools = []
+    for tool in skill.get("tools", []):
+        tools.append({
+            "name": tool["name"],
+            "description": tool.get("description", ""),
+            "schema": tool.get("schema", tool.get("input_schema", {"type": "object"}))
+        })
+
+    return {
+        "id": skill["id"],
+        "name": skill.get("name", skill["id"]),
+        "description": skill.get("description", ""),
+        "keywords": list(skill.get("keywords", [])),
+        "tools": tools
+    }
+
+
+def _catalogue_files(path: str) -> List[str]:
+    """Liste der Katalog-Dateien (eine Datei oder alle *.json eines Verzeichnisses)"""
+    if os.path.isdir(path):
+        return sorted(
+            os.path.join(path, name)
+            for name in os.listdir(path)
+            if name.endswith(".json")
+        )
+    return [path]
+
+
+def _catalogue_stamp(files: List[str]) -> List[list]:
+    """Günstiger Änderungs-Stempel: (Pfad, mtime_ns, Grösse) pro Datei"""
+    stamp = []
+    for filename in files:
+        stat = os.stat(filename)
+        stamp.append([filename, stat.st_mtime_ns, stat.st_size])
+    return stamp
+
+
+def _parse_catalogue(contents: List[bytes]) -> List[Dict[str, Any]]:
+    """Parst Katalog-Dateien; jede enthält {"skills": [...]}, eine Liste oder einen Skill"""
+    skills = []
+    for raw in contents:
+        data = json.loads(raw.decode("utf-8"))
+        if isinstance(data, dict) and "skills" in data:
+            data = data["skills"]
+        if isinstance(data, dict):
+            data = [data]
+        skills.extend(_normalize_skill(skill) for skill in data)
+    return skills
+
+# ==================== TOOL EXECUTION ====================
+
+# Handler-Registry und Prozess-Pool: skill_tools.py
+
+_JSON_TYPES = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "null": (type(None),)
+}
+
+
+def compile_schema_validator(schema: Dict[str, Any]) -> Callable[[Any, str], List[str]]:
+    """
+    Kompiliert ein JSON-Schema (Teilmenge: type, enum, properties, required,
+    items, oneOf) einmalig in eine Prüffunktion value -> Fehlerliste
+    """
+    checks: List[Callable[[Any, str], List[str]]] = []
+
+    expected = schema.get("type")
+    if expected in _JSON_TYPES:
+        types = _JSON_TYPES[expected]
+
+        def check_type(value, path):
+            # bool ist in Python ein int, in JSON aber kein Zahlentyp
+            if not isinstance(value, types) or (isinstance(value, bool) and expected != "boolean"):
+                return [f"{path}: expected {expected}"]
+            return []
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda value, path: [] if value in allowed else [f"{path}: must be one of {allowed}"])
+
+    if "oneOf" in schema:
+        variants = [compile_schema_validator(variant) for variant in schema["oneOf"]]
+
+        def check_one_of(value, path):
+            matches = sum(1 for variant in variants if not variant(value, path))
+            return [] if matches == 1 else [f"{path}: must match exactly one schema in oneOf"]
+        checks.append(check_one_of)
+
+    properties = {
+        name: compile_schema_validator(sub_schema)
+        for name, sub_schema in schema.get("properties", {}).items()
+    }
+    required = list(schema.get("required", []))
+    if properties or required:
+        def check_object(value, path):
+            if not isinstance(value, dict):
+                return []
+            errors = [f"{path}.{name}: required" for name in required if name not in value]
+            for name, validator in properties.items():
+                if name in value:
+                    errors.extend(validator(value[name], f"{path}.{name}"))
+            return errors
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_validator = compile_schema_validator(schema["items"])
+
+        def check_items(value, path):
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for idx, item in enumerate(value):
+                errors.extend(item_validator(item, f"{path}[{idx}]"))
+            return errors
+        checks.append(check_items)
+
+    def validate(value: Any, path: str = "$") -> List[str]:
+        errors = []
+        for check in checks:
+            errors.extend(check(value, path))
+            if errors:
+                break
+        return errors
+
+    return validate
+
+
 # ==================== SKILL SELECTION ENGINE ====================
 
-class SkillSelector:
-    """Intelligente Skill-Selektion basierend auf Keywords"""
+_UMLAUT_FOLDING = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
 
-    def __init__(self, skills: List[Dict]):
-        self.skills = skills
-        logger.info(f"SkillSelector initialized with {len(skills)} skills")
 
-    def select_skills(self, user_request: str, context: str = "") -> Dict[str, Any]:
-        """
-        Analysiert User-Request und wählt relevante Skills aus
+def normalize_text(text: str) -> str:
+    """Case-Folding, Umlaut-Folding (ä -> ae, ß -> ss) und Whitespace-Normalisierung"""
+    text = unicodedata.normalize("NFC", text)
+    return " ".join(text.casefold().translate(_UMLAUT_FOLDING).split())
 
-        Returns:
-            Dict mit selected_skills, scores, reasons, token_savings
-        """
-        request_lower = (user_request + " " + context).lower()
-        selected_skills = []
 
-        for skill in self.skills:
-            score = 0
-            reasons = []
+class KeywordAutomaton:
+    """Aho-Corasick-Automat für Substring-Matching aller Patterns in einem Durchlauf"""
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._always = set()
+
+        for pattern in set(patterns):
+            if not pattern:
+                # Leerer String ist in jedem Text enthalten
+                self._always.add(pattern)
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern)
+
+        # Fail-Links per Breitensuche aufbauen
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
 
-            # Keyword-Matching
+    def to_state(self) -> tuple:
+        """Serialisierbarer Zustand (nur Builtin-Typen, marshal-fähig)"""
+        return (self._goto, self._fail, self._output, sorted(self._always))
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "KeywordAutomaton":
+        """Stellt einen Automaten aus to_state() ohne Neuaufbau wieder her"""
+        automaton = cls.__new__(cls)
+        goto, fail, output, always = state
+        automaton._goto = goto
+        automaton._fail = fail
+        automaton._output = output
+        automaton._always = set(always)
+        return automaton
+
+    def find(self, text: str) -> set:
+        """Liefert alle Patterns, die als Substring in text vorkommen"""
+        found = set(self._always)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class SkillSnapshot:
+    """
+    Unveränderlicher, kompilierter Stand des Skill-Katalogs
+
+    Pro Skill werden die Treffer-Regeln (Pattern, Punkte, Grund) in der
+    Katalog-Reihenfolge abgelegt; der Posting-Index ordnet jedem Pattern
+    die Skills zu, in denen es vorkommt. Ein Snapshot wird nach dem Aufbau
+    nie verändert, Reloads ersetzen ihn als Ganzes.
+    """
+
+    def __init__(self, skills: List[Dict], version: str = ""):
+        self.skills = tuple(skills)
+        self.version = version or hashlib.sha256(
+            json.dumps(skills, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.rules: List[List[tuple]] = []
+        self.postings: Dict[str, List[int]] = {}
+
+        for idx, skill in enumerate(self.skills):
+            rules = []
+
+            # Keyword-Matching: +10 pro Keyword
             for keyword in skill["keywords"]:
-                if keyword.lower() in request_lower:
-                    score += 10
-                    reasons.append(f"Keyword '{keyword}'")
+                rules.append((normalize_text(keyword), 10, f"Keyword '{keyword}'"))
 
-            # Tool-Name-Matching
+            # Tool-Name-Matching: +5 pro Wort im Tool-Namen
             for tool in skill["tools"]:
-                tool_words = tool["name"].split("_")
-                for word in tool_words:
-                    if word.lower() in request_lower:
-                        score += 5
-                        reasons.append(f"Tool '{word}'")
+                for word in tool["name"].split("_"):
+                    rules.append((normalize_text(word), 5, f"Tool '{word}'"))
+
+            self.rules.append(rules)
+            for pattern, _, _ in rules:
+                postings = self.postings.setdefault(pattern, [])
+                if not postings or postings[-1] != idx:
+                    postings.append(idx)
+
+        self.automaton = KeywordAutomaton(list(self.postings))
+        self._engines: Dict[str, Any] = {}
+        self._token_costs: Dict[str, Dict[str, Any]] = {}
+        self._tool_index: Optional[Dict[str, tuple]] = None
+
+    def engine(self, mode: str):
+        """Scoring-Engine für diesen Snapshot (wird beim ersten Zugriff aufgebaut)"""
+        engine = self._engines.get(mode)
+        if engine is None:
+            engine = SCORING_ENGINES[mode](self)
+            self._engines[mode] = engine
+        return engine
+
+    def tool_index(self) -> Dict[str, tuple]:
+        """tool_name -> (skill, tool, kompilierter Schema-Validator), einmal pro Snapshot"""
+        if self._tool_index is None:
+            self._tool_index = {
+                tool["name"]: (skill, tool, compile_schema_validator(tool["schema"]))
+                for skill in self.skills
+                for tool in skill["tools"]
+            }
+        return self._tool_index
+
+    def token_costs(self, estimator: "TokenEstimator") -> Dict[str, Any]:
+        """
+        Gemessene Token-Kosten der Tool-Schemas (pro Tool, pro Skill, gesamt)
+
+        Wird pro Tokenizer einmal berechnet und im Snapshot gehalten.
+        """
+        costs = self._token_costs.get(estimator.name)
+        if costs is None:
+            tools = {}
+            skills = {}
+            for skill in self.skills:
+                skill_total = 0
+                for tool in skill["tools"]:
+                    tokens = estimator.tool_tokens(tool)
+                    tools[tool["name"]] = tokens
+                    skill_total += tokens
+                skills[skill["id"]] = skill_total
+
+            costs = {"tools": tools, "skills": skills, "total": sum(skills.values())}
+            self._token_costs[estimator.name] = costs
+        return costs
+
+    @property
+    def tool_count(self) -> int:
+        return sum(len(skill["tools"]) for skill in self.skills)
+
+    def to_bytes(self) -> bytes:
+        """Serialisiert den kompilierten Snapshot (marshal, kein Pickle)"""
+        return marshal.dumps((
+            SNAPSHOT_FORMAT,
+            self.version,
+            list(self.skills),
+            self.rules,
+            self.postings,
+            self.automaton.to_state()
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SkillSnapshot":
+        """Lädt einen mit to_bytes() gespeicherten Snapshot ohne Neukompilierung"""
+        fmt, version, skills, rules, postings, automaton_state = marshal.loads(data)
+        if fmt != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format {fmt}")
+
+        snapshot = cls.__new__(cls)
+        snapshot.skills = tuple(skills)
+        snapshot.version = version
+        snapshot.rules = rules
+        snapshot.postings = postings
+        snapshot.automaton = KeywordAutomaton.from_state(automaton_state)
+        snapshot._engines = {}
+        snapshot._token_costs = {}
+        snapshot._tool_index = None
+        return snapshot
+
+
+def _read_snapshot_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Gespeicherter Cache-Eintrag oder None
+
+    Dateien fremder Benutzer und Einträge mit falschem Typ oder anderem
+    Snapshot-Format werden ignoriert (der Katalog wird dann neu kompiliert).
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                logger.warning(f"Ignoring skill snapshot cache {cache_path}: owned by another user")
+                return None
+            entry = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != SNAPSHOT_FORMAT:
+        return None
+    return entry
+
+
+def _write_snapshot_cache(cache_path: str, entry: Dict[str, Any]):
+    # Erst in Temp-Datei schreiben, dann atomar ersetzen
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), mode=0o700, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write skill snapshot cache {cache_path}: {e}")
+
+
+def load_skill_snapshot(source: str, cache_path: Optional[str] = None) -> tuple:
+    """
+    Lädt den Skill-Katalog aus source und kompiliert ihn zu einem Snapshot
+
+    Der Cache wird über (Pfad, mtime, Grösse) der Katalog-Dateien geprüft;
+    stimmt der Stempel nicht, entscheidet der SHA-256 des Inhalts, ob der
+    gespeicherte Snapshot noch gilt.
+
+    Returns:
+        (SkillSnapshot, stamp)
+    """
+    files = _catalogue_files(source)
+    stamp = _catalogue_stamp(files)
+    cached = _read_snapshot_cache(cache_path) if cache_path else None
+
+    if cached and cached.get("source") == source and cached.get("stamp") == stamp:
+        try:
+            return SkillSnapshot.from_bytes(cached["snapshot"]), stamp
+        except (KeyError, ValueError, TypeError, EOFError, AttributeError, IndexError):
+            pass
+
+    contents = []
+    for filename in files:
+        with open(filename, "rb") as f:
+            contents.append(f.read())
+    digest = hashlib.sha256(b"\0".join(contents)).hexdigest()
+
+    snapshot = None
+    if cached and cached.get("source") == source and cached.get("sha256") == digest:
+        try:
+            snapshot = SkillSnapshot.from_bytes(cached["snapshot"])
+        except (KeyError, ValueError, TypeError, EOFError, AttributeError, IndexError):
+            snapshot = None
+
+    if snapshot is None:
+        snapshot = SkillSnapshot(_parse_catalogue(contents), version=digest)
+        logger.info(f"Compiled skill catalogue from {source} ({len(snapshot.skills)} skills)")
+
+    if cache_path:
+        _write_snapshot_cache(cache_path, {
+            "format": SNAPSHOT_FORMAT,
+            "source": source,
+            "stamp": stamp,
+            "sha256": digest,
+            "snapshot": snapshot.to_bytes()
+        })
+
+    return snapshot, stamp
+
+
+# ==================== SCORING ENGINES ====================
+
+# Scoring-Modus für SkillSelector: "keyword" (Standard), "bm25" oder "ngram"
+SKILL_SCORING = os.environ.get("SKILL_SCORING", "keyword")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Füllwörter, die in Beschreibungen und Requests kein Routing-Signal tragen
+_STOPWORDS = frozenset("""
+    a an and auf aus bei das dem den der des die ein eine einem einen einer eines
+    for from fuer im in ist mit of on oder the to und von vom zu zum zur
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Zerlegt normalisierten Text in Wort-Tokens"""
+    return _TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class KeywordScorer:
+    """Flache Punkte pro Treffer: +10 pro Keyword, +5 pro Tool-Wort (Substring-Match)"""
+
+    name = "keyword"
+
+    def __init__(self, snapshot: "SkillSnapshot"):
+        self.snapshot = snapshot
+
+    def rank(self, request_text: str, limit: int) -> List[Dict[str, Any]]:
+        snapshot = self.snapshot
+        matched = snapshot.automaton.find(request_text)
+
+        candidates = set()
+        for pattern in matched:
+            candidates.update(snapshot.postings[pattern])
+
+        selected_skills = []
+        for idx in sorted(candidates):
+            score = 0
+            reasons = []
+            for pattern, points, reason in snapshot.rules[idx]:
+                if pattern in matched:
+                    score += points
+                    reasons.append(reason)
 
             if score > 0:
                 selected_skills.append({
-                    "skill": skill,
+                    "skill": snapshot.skills[idx],
                     "score": score,
                     "reasons": reasons
                 })
 
-        # Nach Score sortieren und Top 3 nehmen
-        selected_skills.sort(key=lambda x: x["score"], reverse=True)
-        top_skills = selected_skills[:3]
+        # Partielle Sortierung; nlargest ist stabil wie sort(reverse=True)[:limit]
+        return heapq.nlargest(limit, selected_skills, key=lambda x: x["score"])
+
+
+class BM25Scorer:
+    """
+    BM25-Ranking über Name, Beschreibung, Keywords und Tool-Texte
+
+    Die Gewichte werden beim Aufbau als dünn besetzte Term-Skill-Matrix
+    vorberechnet; ein Request wird mit einem Sparse-Dot-Product gegen den
+    ganzen Katalog bewertet. Ohne SciPy übernimmt ein Posting-Index die
+    gleiche Rechnung in reinem Python.
+    """
+
+    name = "bm25"
+
+    def __init__(self, snapshot: "SkillSnapshot", k1: float = 1.2, b: float = 0.75):
+        self.snapshot = snapshot
+        documents = [self._document(skill) for skill in snapshot.skills]
+        doc_count = len(documents)
+        avg_length = (sum(len(doc) for doc in documents) / doc_count) if doc_count else 0.0
+
+        frequencies = []
+        doc_freq: Dict[str, int] = {}
+        for doc in documents:
+            tf: Dict[str, int] = {}
+            for token in doc:
+                tf[token] = tf.get(token, 0) + 1
+            frequencies.append(tf)
+            for token in tf:
+                doc_freq[token] = doc_freq.get(token, 0) + 1
+
+        self.term_ids = {term: i for i, term in enumerate(sorted(doc_freq))}
+        self.postings: Dict[str, List[tuple]] = {}
+
+        for idx, tf in enumerate(frequencies):
+            norm = k1 * (1 - b + b * len(documents[idx]) / avg_length) if avg_length else k1
+            for term, count in tf.items():
+                df = doc_freq[term]
+                idf = math.log((doc_count - df + 0.5) / (df + 0.5) + 1)
+                weight = idf * count * (k1 + 1) / (count + norm)
+                self.postings.setdefault(term, []).append((idx, weight))
+
+        self.matrix = None
+        if sparse is not None and np is not None and self.postings:
+            rows, cols, data = [], [], []
+            for term, entries in self.postings.items():
+                for idx, weight in entries:
+                    rows.append(self.term_ids[term])
+                    cols.append(idx)
+                    data.append(weight)
+            self.matrix = sparse.csr_matrix(
+                (data, (rows, cols)), shape=(len(self.term_ids), doc_count)
+            ).T.tocsr()
+
+    @staticmethod
+    def _document(skill: Dict[str, Any]) -> List[str]:
+        parts = [skill["name"], skill["description"], " ".join(skill["keywords"])]
+        for tool in skill["tools"]:
+            parts.append(tool["name"].replace("_", " "))
+            parts.append(tool["description"])
+        return [token for token in tokenize(" ".join(parts)) if token not in _STOPWORDS]
+
+    def _scores(self, terms: List[str]) -> List[float]:
+        if self.matrix is not None:
+            query = np.zeros(len(self.term_ids))
+            for term in terms:
+                query[self.term_ids[term]] = 1.0
+            return self.matrix.dot(query)
+
+        scores = [0.0] * len(self.snapshot.skills)
+        for term in terms:
+            for idx, weight in self.postings[term]:
+                scores[idx] += weight
+        return scores
+
+    def rank(self, request_text: str, limit: int) -> List[Dict[str, Any]]:
+        terms = sorted({token for token in tokenize(request_text) if token in self.postings})
+        if not terms:
+            return []
+
+        scores = self._scores(terms)
+        if np is not None and len(scores) > limit:
+            # Partielle Sortierung: nur die Top-Kandidaten vollständig ordnen
+            scores = np.asarray(scores)
+            cutoff = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            candidates = [int(idx) for idx in np.nonzero(scores >= cutoff)[0]]
+        else:
+            candidates = range(len(scores))
+
+        top = heapq.nsmallest(
+            limit,
+            (idx for idx in candidates if scores[idx] > 0),
+            key=lambda idx: (-scores[idx], idx)
+        )
+
+        results = []
+        for idx in top:
+            contributions = sorted(
+                ((weight, term) for term in terms
+                 for doc_idx, weight in self.postings[term] if doc_idx == idx),
+                reverse=True
+            )
+            results.append({
+                "skill": self.snapshot.skills[idx],
+                "score": round(float(scores[idx]), 2),
+                "reasons": [f"Term '{term}'" for _, term in contributions]
+            })
+        return results
+
+
+class NgramScorer:
+    """
+    Semantisches Routing über gehashte Zeichen-N-Gramme (ohne Modell-Download)
+
+    Jeder Skill wird beim Aufbau als L2-normierter Vektor aus Zeichen-
+    N-Grammen seiner Wörter abgelegt (NumPy-Matrix, sonst Python-Dicts).
+    Ein Request braucht ein Matrix-Vektor-Produkt (Kosinus-Ähnlichkeit);
+    flektierte Formen und Komposita wie "Präsentationsfolien" teilen
+    genug N-Gramme mit "präsentation" und "folien".
+    """
+
+    name = "ngram"
+
+    def __init__(self, snapshot: "SkillSnapshot", dimensions: int = 4096,
+                 sizes: tuple = (3, 4, 5), threshold: float = 0.1):
+        self.snapshot = snapshot
+        self.dimensions = dimensions
+        self.sizes = sizes
+        self.threshold = threshold
+        self.vocabulary: List[Dict[str, set]] = []
+
+        vectors = []
+        for skill in snapshot.skills:
+            tokens = BM25Scorer._document(skill)
+            self.vocabulary.append({token: set(self._ngrams(token)) for token in tokens})
+            vectors.append(self._vector(tokens))
+
+        if np is not None:
+            self.matrix = np.zeros((len(vectors), dimensions), dtype=np.float32)
+            for idx, vector in enumerate(vectors):
+                for bucket, value in vector.items():
+                    self.matrix[idx, bucket] = value
+            self.vectors = None
+        else:
+            self.matrix = None
+            self.vectors = vectors
+
+    def _ngrams(self, token: str) -> List[str]:
+        padded = f"<{token}>"
+        return [
+            padded[i:i + size]
+            for size in self.sizes
+            for i in range(len(padded) - size + 1)
+        ]
+
+    def _vector(self, tokens: List[str]) -> Dict[int, float]:
+        """Gehashter, L2-normierter N-Gramm-Vektor (crc32 ist prozessübergreifend stabil)"""
+        vector: Dict[int, float] = {}
+        for token in tokens:
+            for gram in self._ngrams(token):
+                bucket = zlib.crc32(gram.encode("utf-8")) % self.dimensions
+                vector[bucket] = vector.get(bucket, 0.0) + 1.0
+
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if norm:
+            for bucket in vector:
+                vector[bucket] /= norm
+        return vector
+
+    def _scores(self, query: Dict[int, float]) -> List[float]:
+        if self.matrix is not None:
+            dense = np.zeros(self.dimensions, dtype=np.float32)
+            for bucket, value in query.items():
+                dense[bucket] = value
+            return self.matrix.dot(dense)
+
+        return [
+            sum(value * vector.get(bucket, 0.0) for bucket, value in query.items())
+            for vector in self.vectors
+        ]
+
+    def rank(self, request_text: str, limit: int) -> List[Dict[str, Any]]:
+        tokens = [token for token in tokenize(request_text) if token not in _STOPWORDS]
+        query = self._vector(tokens)
+        if not query or not self.snapshot.skills:
+            return []
+
+        scores = self._scores(query)
+        top = heapq.nsmallest(
+            limit,
+            (idx for idx in range(len(scores)) if scores[idx] >= self.threshold),
+            key=lambda idx: (-scores[idx], idx)
+        )
+
+        request_grams = set()
+        for token in tokens:
+            request_grams.update(self._ngrams(token))
+
+        results = []
+        for idx in top:
+            # Begründung: Skill-Wörter, deren N-Gramme zur Hälfte im Request vorkommen
+            reasons = [
+                f"Ähnlich '{token}'"
+                for token, grams in self.vocabulary[idx].items()
+                if grams and len(grams & request_grams) * 2 >= len(grams)
+            ]
+            results.append({
+                "skill": self.snapshot.skills[idx],
+                "score": round(float(scores[idx]), 3),
+                "reasons": reasons
+            })
+        return results
+
+
+SCORING_ENGINES = {
+    KeywordScorer.name: KeywordScorer,
+    BM25Scorer.name: BM25Scorer,
+    NgramScorer.name: NgramScorer
+}
+
+
+# ==================== TOKEN ESTIMATION ====================
+
+# Tokenizer für die Token-Bilanz: "heuristic" (Bytes / 4) oder "tiktoken" falls installiert
+SKILL_TOKENIZER = os.environ.get("SKILL_TOKENIZER", "heuristic")
+
+
+def _heuristic_token_count(text: str) -> int:
+    """Schnelle Schätzung: ~4 UTF-8 Bytes pro Token"""
+    return max(1, math.ceil(len(text.encode("utf-8")) / 4))
+
+
+class TokenEstimator:
+    """Zählt Tokens mit einem austauschbaren Tokenizer, Fallback ist die Byte-Heuristik"""
+
+    def __init__(self, tokenizer: str = "heuristic"):
+        self.name = "heuristic"
+        self._count = _heuristic_token_count
+
+        if tokenizer == "tiktoken":
+            try:
+                import tiktoken
+                encoding = tiktoken.get_encoding("cl100k_base")
+                self._count = lambda text: len(encoding.encode(text))
+                self.name = "tiktoken/cl100k_base"
+            except Exception as e:
+                logger.warning(f"tiktoken unavailable, using byte heuristic: {e}")
+        elif tokenizer != "heuristic":
+            logger.warning(f"Unknown tokenizer '{tokenizer}', using byte heuristic")
+
+    def count(self, text: str) -> int:
+        return self._count(text)
+
+    def tool_tokens(self, tool: Dict[str, Any]) -> int:
+        """Tokens einer Tool-Definition, so wie sie an den Client serialisiert wird"""
+        return self.count(json.dumps(
+            {"name": tool["name"], "description": tool["description"], "inputSchema": tool["schema"]},
+            ensure_ascii=False,
+            separators=(",", ":")
+        ))
+
+
+token_estimator = TokenEstimator(SKILL_TOKENIZER)
+
+
+def _savings_percentage(without_routing: int, with_routing: int) -> int:
+    if not without_routing:
+        return 0
+    return round((1 - (with_routing / without_routing)) * 100)
+
+
+class SkillSelector:
+    """Intelligente Skill-Selektion basierend auf Keywords"""
+
+    def __init__(self, skills: Optional[List[Dict]] = None, source: Optional[str] = None,
+                 cache_path: Optional[str] = None, scoring: str = "keyword",
+                 estimator: Optional[TokenEstimator] = None):
+        if scoring not in SCORING_ENGINES:
+            raise ValueError(f"Unknown scoring mode '{scoring}', expected one of {sorted(SCORING_ENGINES)}")
+
+        self.scoring = scoring
+        self.estimator = estimator or token_estimator
+        # Token-Kosten des Router-Tools selbst, wird nach der Tool-Registrierung gesetzt
+        self.router_tokens = 0
+        self.source = source
+        self.cache_path = cache_path
+        self._stamp = None
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+
+        if source:
+            self._snapshot, self._stamp = load_skill_snapshot(source, cache_path)
+        else:
+            self._snapshot = SkillSnapshot(skills or [])
+
+        self._snapshot.engine(self.scoring)
+        self._snapshot.token_costs(self.estimator)
+        self._snapshot.tool_index()
+        logger.info(f"SkillSelector initialized with {len(self.skills)} skills ({scoring} scoring)")
+
+    @property
+    def snapshot(self) -> SkillSnapshot:
+        return self._snapshot
+
+    @property
+    def skills(self) -> tuple:
+        return self._snapshot.skills
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Lädt den Katalog neu, falls sich die Quelle geändert hat
+
+        Der neue Snapshot wird vollständig aufgebaut und dann per
+        Referenz-Zuweisung getauscht; laufende Anfragen arbeiten mit
+        ihrem bereits gelesenen Snapshot weiter.
+        """
+        if not self.source:
+            return False
+
+        with self._reload_lock:
+            try:
+                stamp = _catalogue_stamp(_catalogue_files(self.source))
+                if not force and stamp == self._stamp:
+                    return False
+
+                snapshot, stamp = load_skill_snapshot(self.source, self.cache_path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.error(f"Skill catalogue reload failed, keeping current version: {e}")
+                return False
+
+            self._stamp = stamp
+            if snapshot.version == self._snapshot.version:
+                return False
+
+            # Engine vor dem Tausch aufbauen, damit keine Anfrage darauf wartet
+            snapshot.engine(self.scoring)
+            snapshot.token_costs(self.estimator)
+            snapshot.tool_index()
+            self._snapshot = snapshot
+            logger.info(f"Skill catalogue reloaded: {len(snapshot.skills)} skills")
+            return True
+
+    def start_watcher(self, interval: float):
+        """Startet einen Daemon-Thread, der die Katalog-Quelle periodisch prüft"""
+        if not self.source or interval <= 0 or self._watcher:
+            return
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                self.reload()
+
+        self._watcher = threading.Thread(target=watch, name="skill-catalogue-watcher", daemon=True)
+        self._watcher.start()
+
+    def _rank(self, snapshot: SkillSnapshot, request_text: str) -> List[Dict[str, Any]]:
+        """Top 3 Skills mit der konfigurierten Scoring-Engine"""
+        return snapshot.engine(self.scoring).rank(request_text, 3)
+
+    def select_skills_batch(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Routet viele (user_request, context)-Paare in einem Durchlauf
+
+        Alle Requests laufen gegen denselben Snapshot; identische
+        normalisierte Requests werden nur einmal gematcht.
+
+        Returns:
+            Kompakte Ergebnisse in Eingabe-Reihenfolge: skills (id, score) und tools
+        """
+        snapshot = self._snapshot
+        costs = snapshot.token_costs(self.estimator)
+        compiled: Dict[str, Dict[str, Any]] = {}
+        results = []
+
+        for user_request, context in requests:
+            request_text = normalize_text(user_request) + " " + normalize_text(context)
+            compact = compiled.get(request_text)
+
+            if compact is None:
+                top_skills = self._rank(snapshot, request_text)
+                with_routing = self.router_tokens + sum(
+                    costs["skills"][item["skill"]["id"]] for item in top_skills
+                )
+                compact = {
+                    "skills": [
+                        {"id": item["skill"]["id"], "score": item["score"]}
+                        for item in top_skills
+                    ],
+                    "tools": [
+                        tool["name"]
+                        for item in top_skills
+                        for tool in item["skill"]["tools"]
+                    ],
+                    "with_routing": with_routing
+                }
+                compiled[request_text] = compact
+
+            results.append(compact)
+
+        logger.info(f"Routed batch of {len(requests)} requests ({len(compiled)} unique)")
+        return results
+
+    def select_skills(self, user_request: str, context: str = "",
+                      include_schema: bool = False) -> Dict[str, Any]:
+        """
+        Analysiert User-Request und wählt relevante Skills aus
+
+        Mit include_schema=True enthält jedes Tool zusätzlich sein Input-Schema.
+
+        Returns:
+            Dict mit selected_skills, scores, reasons, token_savings
+        """
+        snapshot = self._snapshot
+        request_text = normalize_text(user_request) + " " + normalize_text(context)
+        top_skills = self._rank(snapshot, request_text)
 
         # Tools sammeln
         selected_tools = []
         for item in top_skills:
             skill = item["skill"]
             for tool in skill["tools"]:
-                selected_tools.append({
+                entry = {
                     "name": tool["name"],
                     "description": tool["description"],
                     "skill_id": skill["id"],
                     "skill_name": skill["name"]
-                })
+                }
+                if include_schema:
+                    entry["schema"] = tool["schema"]
+                selected_tools.append(entry)
 
-        # Token-Berechnung
-        traditional_tokens = 890  # Alle Skills
-        router_tokens = 8 + (len(selected_tools) * 50)  # Router + ausgewählte Tools
-        savings_pct = round((1 - (router_tokens / traditional_tokens)) * 100)
+        # Token-Berechnung aus den gemessenen Schema-Grössen
+        costs = snapshot.token_costs(self.estimator)
+        traditional_tokens = costs["total"]  # Alle Skills
+        router_tokens = self.router_tokens + sum(  # Router + ausgewählte Tools
+            costs["tools"][tool["name"]] for tool in selected_tools
+        )
+        savings_pct = _savings_percentage(traditional_tokens, router_tokens)
 
         result = {
             "success": True,
@@ -268,67 +1159,262 @@ class SkillSelector:
         logger.info(f"Selected {len(top_skills)} skills with {savings_pct}% token savings")
         return result
 
+def _create_skill_selector() -> SkillSelector:
+    """Katalog aus SKILLS_PATH laden, sonst auf die eingebauten SKILLS zurückfallen"""
+    if os.path.exists(SKILLS_PATH):
+        try:
+            return SkillSelector(source=SKILLS_PATH, cache_path=SKILLS_CACHE_PATH, scoring=SKILL_SCORING)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error(f"Could not load skill catalogue {SKILLS_PATH}: {e}")
+    else:
+        logger.warning(f"Skill catalogue {SKILLS_PATH} not found, using built-in skills")
+    return SkillSelector(SKILLS, scoring=SKILL_SCORING)
+
 # Initialize skill selector
-skill_selector = SkillSelector(SKILLS)
+skill_selector = _create_skill_selector()
+skill_selector.start_watcher(SKILLS_RELOAD_INTERVAL)
+
+# ==================== ROUTING CACHE ====================
+
+# Maximale Anzahl Einträge und Lebensdauer (Sekunden) im Routing-Cache
+ROUTER_CACHE_SIZE = int(os.environ.get("ROUTER_CACHE_SIZE", "1024"))
+ROUTER_CACHE_TTL = float(os.environ.get("ROUTER_CACHE_TTL", "300"))
+
+
+class RoutingCache:
+    """
+    Begrenzter LRU/TTL-Cache für Routing-Ergebnisse
+
+    Schlüssel ist der normalisierte Request + Kontext. Ändert sich die
+    Katalog-Version, wird der Cache komplett verworfen.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(user_request: str, context: str = "", output: str = "text") -> tuple:
+        return (normalize_text(user_request), normalize_text(context), output)
+
+    def _check_version(self, version: str):
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: tuple, version: str) -> Optional[Any]:
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, version: str, value: Any):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+routing_cache = RoutingCache(ROUTER_CACHE_SIZE, ROUTER_CACHE_TTL)
+
+
+class SavingsLedger:
+    """Laufende Summen der Token-Bilanz über alle gerouteten Requests"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.without_routing = 0
+        self.with_routing = 0
+
+    def record(self, without_routing: int, with_routing: int):
+        with self._lock:
+            self.requests += 1
+            self.without_routing += without_routing
+            self.with_routing += with_routing
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "without_routing": self.without_routing,
+            "with_routing": self.with_routing,
+            "saved": self.without_routing - self.with_routing,
+            "savings_percentage": _savings_percentage(self.without_routing, self.with_routing)
+        }
+
+
+savings_ledger = SavingsLedger()
+
+
+def _format_router_response(result: Dict[str, Any]) -> str:
+    """Formatiert ein Routing-Ergebnis (ohne Request-Zeile) als Text"""
+    scores = {item["id"]: item["score"] for item in result["scores"]}
+    savings = result["token_savings"]
+
+    lines = [f"✅ Ausgewählte Skills ({len(result['selected_skills'])}):", ""]
+    for skill in result["selected_skills"]:
+        reasons = result["selection_reasoning"].get(skill["id"], [])
+        lines.append(f"  • {skill['name']}  (Score: {scores.get(skill['id'], 0)})")
+        lines.append(f"    Gründe: {', '.join(reasons[:3])}")
+
+    lines += [
+        "",
+        "💰 Token-Einsparung:",
+        f"  • Ohne Routing: {savings['without_routing']} Tokens",
+        f"  • Mit Routing:   {savings['with_routing']} Tokens",
+        f"  • Ersparnis:     {savings['savings_percentage']}%",
+        "",
+        f"🔧 Verfügbare Tools ({len(result['tools'])}):",
+        ""
+    ]
+    lines += [f"  • {tool['name']} ({tool['skill_name']})" for tool in result["tools"]]
+
+    return "\n".join(lines)
 
 # ==================== MCP TOOLS ====================
 
 @mcp.tool()
-async def skill_router(user_request: str, context: str = "") -> str:
+async def skill_router(user_request: str, context: str = "", output: str = "text") -> str:
     """
     🎯 Intelligenter Skill-Router
 
     Analysiert User-Anfragen und lädt nur benötigte Skills.
     Token-Einsparung: ~90%
 
-    Verfügbare Skills:
-    - PowerPoint: Präsentationen erstellen
-    - Excel: Tabellen erstellen und analysieren
-    - Brand Guidelines: Marken-Richtlinien anwenden
-    - PDF: Dokumente lesen und verarbeiten
-    - Code Review: Code-Qualität prüfen
-    - Blog Writer: Blog-Artikel schreiben
+    Die verfügbaren Skills stammen aus dem Skill-Katalog (SKILLS_PATH)
+    und können sich zur Laufzeit ändern; list_all_skills zeigt den
+    aktuellen Stand.
+
+    output="json" liefert das Routing-Ergebnis als kompaktes JSON inkl.
+    vollständigem Input-Schema jedes ausgewählten Tools.
     """
-    result = skill_selector.select_skills(user_request, context)
+    version = skill_selector.snapshot.version
+    output = "json" if output == "json" else "text"
+    key = RoutingCache.make_key(user_request, context, output)
+
+    if output == "json":
+        result = routing_cache.get(key, version)
+        if result is None:
+            result = skill_selector.select_skills(user_request, context, include_schema=True)
+            routing_cache.put(key, version, result)
+
+        savings_ledger.record(
+            result["token_savings"]["without_routing"],
+            result["token_savings"]["with_routing"]
+        )
+        result = dict(result, request_analysis={
+            "original_request": user_request,
+            "context": context or "none"
+        })
+        return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+    cached = routing_cache.get(key, version)
+
+    if cached is None:
+        result = skill_selector.select_skills(user_request, context)
+        cached = (_format_router_response(result), result["token_savings"])
+        routing_cache.put(key, version, cached)
+
+    body, savings = cached
+    savings_ledger.record(savings["without_routing"], savings["with_routing"])
 
     # Formatierte Antwort
-    response = f"""🎯 Skill-Router Analyse
+    return f"""🎯 Skill-Router Analyse
 
 Request: {user_request}
 
-✅ Ausgewählte Skills ({len(result['selected_skills'])}):
-"""
-
-    for skill in result["selected_skills"]:
-        reasons = result["selection_reasoning"].get(skill["id"], [])
-        response += f"\n  • {skill['name']}  (Score: {next((s['score'] for s in result['scores'] if s['id'] == skill['id']), 0)})"
-        response += f"\n    Gründe: {', '.join(reasons[:3])}"
+{body}"""
 
-    response += f"""
+@mcp.tool()
+async def skill_router_batch(requests: List[Any]) -> str:
+    """
+    🎯 Skill-Router für viele Anfragen in einem Aufruf
 
-💰 Token-Einsparung:
-  • Ohne Routing: {result['token_savings']['without_routing']} Tokens
-  • Mit Routing:   {result['token_savings']['with_routing']} Tokens
-  • Ersparnis:     {result['token_savings']['savings_percentage']}%
+    Jeder Eintrag ist entweder ein String (user_request) oder ein Objekt
+    {"user_request": "...", "context": "..."}. Antwort ist kompaktes JSON
+    mit einem Ergebnis pro Eintrag in Eingabe-Reihenfolge.
+    """
+    if not requests:
+        return json.dumps({"success": False, "error": "requests list is required"})
 
-🔧 Verfügbare Tools ({len(result['tools'])}):
-"""
+    pairs = []
+    errors = {}
+    for idx, item in enumerate(requests):
+        if isinstance(item, str):
+            pairs.append((item, ""))
+        elif isinstance(item, dict) and isinstance(item.get("user_request"), str):
+            pairs.append((item["user_request"], str(item.get("context") or "")))
+        else:
+            errors[idx] = "expected string or {user_request, context}"
+            pairs.append(("", ""))
 
-    for tool in result["tools"]:
-        response += f"\n  • {tool['name']} ({tool['skill_name']})"
+    routed = skill_selector.select_skills_batch(pairs)
+    without_routing = skill_selector.snapshot.token_costs(skill_selector.estimator)["total"]
+    for idx, compact in enumerate(routed):
+        if idx not in errors:
+            savings_ledger.record(without_routing, compact["with_routing"])
+    results = [
+        {"index": idx, "error": errors[idx]} if idx in errors else {"index": idx, **compact}
+        for idx, compact in enumerate(routed)
+    ]
 
-    return response
+    return json.dumps(
+        {"success": True, "count": len(results), "results": results},
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
 
 @mcp.tool()
 async def list_all_skills() -> str:
     """
     Liste alle verfügbaren Skills auf
     """
-    response = f"""📚 Verfügbare Skills ({len(SKILLS)}):
+    skills = skill_selector.skills
+    response = f"""📚 Verfügbare Skills ({len(skills)}):
 
 """
 
-    for skill in SKILLS:
+    for skill in skills:
         response += f"""
 {skill['name']}
   ID: {skill['id']}
@@ -337,7 +1423,7 @@ async def list_all_skills() -> str:
   Tools: {len(skill['tools'])}
 """
 
-    response += f"""
+    response += """
 💡 Tipp: Verwende skill_router(user_request) um automatisch die richtigen Skills auszuwählen.
 
 Token-Optimierung: ~90% Einsparung durch intelligentes Routing!
@@ -348,39 +1434,96 @@ Token-Optimierung: ~90% Einsparung durch intelligentes Routing!
 @mcp.tool()
 async def execute_skill_tool(tool_name: str, parameters: Dict[str, Any]) -> str:
     """
-    Führt ein Skill-Tool aus (simuliert in dieser Version)
+    Führt ein Skill-Tool aus
+
+    Parameter werden gegen das Input-Schema des Tools geprüft. Tools ohne
+    registrierten Handler werden weiterhin nur simuliert.
     """
-    # Finde Skill für dieses Tool
-    skill_name = "Unknown"
-    for skill in SKILLS:
-        if any(tool["name"] == tool_name for tool in skill["tools"]):
-            skill_name = skill["name"]
-            break
-
-    result = {
-        "simulated": True,
-        "tool": tool_name,
-        "skill": skill_name,
-        "parameters": parameters,
-        "message": f"✅ Tool '{tool_name}' würde in Produktion ausgeführt",
-        "note": "Dies ist eine Simulation. In Produktion würde das Tool die reale Aktion ausführen."
-    }
+    entry = skill_selector.snapshot.tool_index().get(tool_name)
+    if entry is None:
+        return json.dumps({"success": False, "tool": tool_name, "error": f"Unknown tool '{tool_name}'"},
+                          indent=2, ensure_ascii=False)
+
+    skill, tool, validator = entry
+    errors = validator(parameters, "parameters")
+    if errors:
+        return json.dumps({"success": False, "tool": tool_name, "skill": skill["name"], "errors": errors},
+                          indent=2, ensure_ascii=False)
+
+    # Defaults aus dem Schema ergänzen
+    params = dict(parameters)
+    for name, prop in tool["schema"].get("properties", {}).items():
+        if name not in params and "default" in prop:
+            params[name] = prop["default"]
+
+    try:
+        output = await run_tool_handler(tool_name, params)
+    except Exception as e:
+        logger.error(f"Tool {tool_name} failed: {e}")
+        return json.dumps({"success": False, "tool": tool_name, "skill": skill["name"], "error": str(e)},
+                          indent=2, ensure_ascii=False)
+
+    if output is None:
+        result = {
+            "simulated": True,
+            "tool": tool_name,
+            "skill": skill["name"],
+            "parameters": params,
+            "message": f"✅ Tool '{tool_name}' würde in Produktion ausgeführt",
+            "note": "Für dieses Tool ist kein Handler registriert. In Produktion würde das Tool die reale Aktion ausführen."
+        }
+    else:
+        result = {"success": True, "tool": tool_name, "skill": skill["name"], "result": output}
+
+    return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+
+def _tool_definition(tool: Any) -> Dict[str, Any]:
+    """
+    Definition eines registrierten MCP-Tools in der Form der Katalog-Tools
+    (name, description, schema), damit TokenEstimator.tool_tokens() beide
+    gleich serialisiert
+
+    Das Input-Schema wird wie bei FastMCP per Pydantic aus der Signatur erzeugt.
+    """
+    from pydantic import create_model
+
+    schema = getattr(tool, "parameters", None)
+    fn = getattr(tool, "fn", tool)
+    if not isinstance(schema, dict):
+        hints = get_type_hints(fn)
+        fields = {
+            name: (hints.get(name, Any), ... if param.default is inspect.Parameter.empty else param.default)
+            for name, param in inspect.signature(fn).parameters.items()
+        }
+        schema = create_model(f"{fn.__name__}Arguments", **fields).model_json_schema()
+    return {"name": fn.__name__, "description": inspect.getdoc(fn) or "", "schema": schema}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+# Router-Overhead: das skill_router-Tool selbst muss immer geladen sein
+skill_selector.router_tokens = token_estimator.tool_tokens(_tool_definition(skill_router))
 
 # ==================== MCP RESOURCES ====================
 
 @mcp.resource("skill://router/stats")
 async def router_stats() -> str:
     """Statistiken über das Skill-Routing-System"""
+    snapshot = skill_selector.snapshot
+    costs = snapshot.token_costs(skill_selector.estimator)
     stats = {
-        "total_skills": len(SKILLS),
-        "skill_names": [skill["name"] for skill in SKILLS],
-        "total_tools": sum(len(skill["tools"]) for skill in SKILLS),
+        "total_skills": len(snapshot.skills),
+        "skill_names": [skill["name"] for skill in snapshot.skills],
+        "total_tools": snapshot.tool_count,
+        "catalogue": {
+            "source": skill_selector.source or "built-in",
+            "scoring": skill_selector.scoring,
+            "version": snapshot.version[:12]
+        },
+        "routing_cache": routing_cache.stats(),
         "token_optimization": {
-            "traditional_approach": "890 tokens (all skills)",
-            "with_router": "8 tokens (router only)",
-            "average_savings": "80-90%"
+            "tokenizer": skill_selector.estimator.name,
+            "router_tokens": skill_selector.router_tokens,
+            "all_skills_tokens": costs["total"],
+            "skill_tokens": costs["skills"],
+            "totals": savings_ledger.stats()
         }
     }
     return json.dumps(stats, indent=2, ensure_ascii=False)
@@ -394,9 +1537,11 @@ if __name__ == "__main__":
     logger.info("=" * 60)
     logger.info("🎯 Remote MCP Server with Skill-Routing")
     logger.info("=" * 60)
-    logger.info(f"Skills loaded: {len(SKILLS)}")
-    logger.info(f"Total tools: {sum(len(s['tools']) for s in SKILLS)}")
-    logger.info(f"Token optimization: ~90%")
+    logger.info(f"Skill catalogue: {skill_selector.source or 'built-in'}")
+    logger.info(f"Skills loaded: {len(skill_selector.skills)}")
+    logger.info(f"Total tools: {skill_selector.snapshot.tool_count}")
+    logger.info(f"Token budget: {skill_selector.snapshot.token_costs(skill_selector.estimator)['total']} tokens "
+                f"for all skills, {skill_selector.router_tokens} for the router")
     logger.info(f"Port: {port}")
     logger.info("=" * 60)
 
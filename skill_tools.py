@@ -0,0 +1,186 @@
+"""
+Skill-Tool-Handler für skill-router.py
+
+Registry der ausführbaren Tools (Dokument-Erzeugung, Excel/PDF lesen)
+und ihre Ausführung. CPU-lastige Handler laufen in einem Prozess-Pool;
+sie liegen in diesem importierbaren Modul, weil der Pool Funktionen per
+Modulname und Funktionsname überträgt (skill-router.py selbst ist wegen
+des Bindestrichs nicht importierbar).
+
+Abhängigkeiten der Handler (python-pptx, openpyxl, pypdf) werden erst beim
+Aufruf importiert.
+"""
+
+import asyncio
+import logging
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("skill-router")
+
+# Ausgabe-Verzeichnis für erzeugte Dateien (wie file-server.js)
+OUTPUT_DIR = os.environ.get(
+    "OUTPUT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+)
+# Wurzel für Dateien, die Tools lesen dürfen (read_excel_file, read_pdf, list_pdfs)
+INPUT_DIR = os.environ.get("INPUT_DIR", OUTPUT_DIR)
+# Grösse des Prozess-Pools für CPU-lastige Tools (Dokument-Erzeugung, PDF-Parsing)
+TOOL_WORKERS = int(os.environ.get("TOOL_WORKERS", "2"))
+
+# tool_name -> (handler, cpu_bound); Handler sind Funktionen dieses Moduls, damit
+# sie per Referenz (skill_tools.<name>) an den Prozess-Pool übergeben werden können
+TOOL_HANDLERS: Dict[str, tuple] = {}
+
+
+def tool_handler(*tool_names: str, cpu_bound: bool = False):
+    """Registriert eine Funktion params -> dict als Handler für die genannten Tools"""
+    def register(fn):
+        for name in tool_names:
+            TOOL_HANDLERS[name] = (fn, cpu_bound)
+        return fn
+    return register
+
+
+def _output_path(filename: str, extension: str) -> str:
+    """Dateiname ohne Verzeichnisanteile im OUTPUT_DIR"""
+    name = os.path.basename(filename) or f"output{extension}"
+    if not name.lower().endswith(extension):
+        name += extension
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    return os.path.join(OUTPUT_DIR, name)
+
+
+def _input_path(path: str) -> str:
+    """
+    Löst einen Client-Pfad gegen INPUT_DIR auf
+
+    Symlinks und '..' werden aufgelöst; Pfade ausserhalb von INPUT_DIR
+    werden abgelehnt.
+    """
+    root = os.path.realpath(INPUT_DIR)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if resolved != root and not resolved.startswith(root + os.sep):
+        raise PermissionError(f"Pfad ausserhalb von INPUT_DIR nicht erlaubt: {path}")
+    return resolved
+
+
+@tool_handler("create_powerpoint", "create_powerpoint_presentation", cpu_bound=True)
+def _create_powerpoint(params: Dict[str, Any]) -> Dict[str, Any]:
+    from pptx import Presentation
+
+    presentation = Presentation()
+    title = params.get("title")
+    if title:
+        slide = presentation.slides.add_slide(presentation.slide_layouts[0])
+        slide.shapes.title.text = title
+
+    for item in params["slides"]:
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = item.get("title", "")
+        body = slide.placeholders[1].text_frame
+        for idx, line in enumerate(item.get("content", [])):
+            paragraph = body.paragraphs[0] if idx == 0 else body.add_paragraph()
+            paragraph.text = line
+
+    path = _output_path(params.get("filename") or title or "praesentation", ".pptx")
+    presentation.save(path)
+    return {"file": path, "slides": len(presentation.slides)}
+
+
+@tool_handler("create_excel", "create_excel_spreadsheet", cpu_bound=True)
+def _create_excel(params: Dict[str, Any]) -> Dict[str, Any]:
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    rows = 0
+    for idx, sheet in enumerate(params["sheets"]):
+        worksheet = workbook.create_sheet(title=(sheet.get("name") or f"Sheet{idx + 1}")[:31])
+        for row in sheet.get("data", []):
+            worksheet.append(row)
+            rows += 1
+
+    path = _output_path(params["filename"], ".xlsx")
+    workbook.save(path)
+    return {"file": path, "sheets": len(params["sheets"]), "rows": rows}
+
+
+@tool_handler("read_excel_file", cpu_bound=True)
+def _read_excel(params: Dict[str, Any]) -> Dict[str, Any]:
+    from openpyxl import load_workbook
+
+    path = _input_path(params["filepath"])
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    sheets = {
+        worksheet.title: [list(row) for row in worksheet.iter_rows(values_only=True)]
+        for worksheet in workbook.worksheets
+    }
+    workbook.close()
+    return {"file": path, "sheets": sheets}
+
+
+@tool_handler("read_pdf", cpu_bound=True)
+def _read_pdf(params: Dict[str, Any]) -> Dict[str, Any]:
+    from pypdf import PdfReader
+
+    path = _input_path(params["filepath"])
+    reader = PdfReader(path)
+    pages = list(range(len(reader.pages)))
+    page_range = params.get("page_range", "all")
+    if page_range and page_range != "all":
+        start, _, end = page_range.partition("-")
+        pages = pages[int(start) - 1:int(end or start)]
+
+    return {
+        "file": path,
+        "page_count": len(reader.pages),
+        "pages": [{"page": idx + 1, "text": reader.pages[idx].extract_text() or ""} for idx in pages]
+    }
+
+
+@tool_handler("list_pdfs")
+def _list_pdfs(params: Dict[str, Any]) -> Dict[str, Any]:
+    directory = _input_path(params["directory"])
+    files = sorted(name for name in os.listdir(directory) if name.lower().endswith(".pdf"))
+    return {"directory": directory, "files": files, "count": len(files)}
+
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(max_workers=TOOL_WORKERS)
+    return _process_pool
+
+
+async def run_tool_handler(tool_name: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Führt den registrierten Handler aus; CPU-lastige Handler laufen im
+    begrenzten Prozess-Pool, alle anderen in einem Thread, damit der
+    Event-Loop für andere MCP-Sessions frei bleibt
+
+    Returns:
+        Handler-Ergebnis oder None, wenn für das Tool kein Handler existiert
+    """
+    registered = TOOL_HANDLERS.get(tool_name)
+    if registered is None:
+        return None
+
+    handler, cpu_bound = registered
+    loop = asyncio.get_running_loop()
+    if cpu_bound and TOOL_WORKERS > 0:
+        try:
+            return await loop.run_in_executor(_get_process_pool(), handler, params)
+        except pickle.PicklingError as e:
+            # Handler oder Parameter nicht übertragbar (z.B. Modul unter anderem Namen geladen)
+            logger.warning(f"Tool {tool_name} runs in a thread, process pool unavailable: {e}")
+    return await loop.run_in_executor(None, handler, params)
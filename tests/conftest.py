@@ -0,0 +1,46 @@
+"""
+Gemeinsame Einrichtung der Unit-Tests
+
+Die Module liegen nicht in einem Paket: das Repo-Verzeichnis und typedb/
+kommen auf den Suchpfad, skill-router.py wird über importlib geladen.
+Kein Test braucht Netzwerk oder einen TypeDB-Server.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "typedb")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+class FakeClock:
+    """Steuerbare Uhr für TTL-Tests"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(scope="session")
+def skill_router(tmp_path_factory):
+    # Eigener Snapshot-Cache, damit der Test nichts im Benutzer-Cache ablegt
+    os.environ.setdefault("SKILLS_CACHE_PATH", str(tmp_path_factory.mktemp("skills") / "catalogue.bin"))
+    spec = importlib.util.spec_from_file_location("skill_router", os.path.join(ROOT, "skill-router.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
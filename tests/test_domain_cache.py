@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+import domain_checker
+from domain_checker import DomainCache, DomainChecker, normalize_domain
+
+
+@pytest.fixture
+def patched_clock(clock, monkeypatch):
+    monkeypatch.setattr(domain_checker.time, "time", clock)
+    return clock
+
+
+@pytest.mark.parametrize("raw", ["example.com", "Example.COM", "example.com.", "  EXAMPLE.com.  "])
+def test_normalize_domain(raw):
+    assert normalize_domain(raw) == "example.com"
+
+
+def test_deduplicate_uses_the_same_normal_form():
+    assert DomainChecker.deduplicate(["Example.COM", "example.com.", "b.org", " B.org "]) == ["example.com", "b.org"]
+
+
+def test_spellings_share_one_memory_entry():
+    cache = DomainCache(db_path="")
+
+    async def scenario():
+        await cache.put("whois", "Example.COM", {"available": False}, 60)
+        return await cache.get("whois", "example.com.")
+
+    assert asyncio.run(scenario()) == {"available": False}
+    assert cache.snapshot()["size"] == 1
+
+
+def test_spellings_share_one_sqlite_entry(tmp_path):
+    path = str(tmp_path / "cache.db")
+
+    async def scenario():
+        await DomainCache(db_path=path).put("dns", "EXAMPLE.com.", {"resolvable": True}, 60)
+        fresh = DomainCache(db_path=path)
+        return fresh, await fresh.get("dns", "example.com")
+
+    fresh, value = asyncio.run(scenario())
+    assert value == {"resolvable": True}
+    assert fresh.stats["sqlite_hits"] == 1
+
+
+def test_get_returns_a_copy_without_cache_flags():
+    cache = DomainCache(db_path="")
+
+    async def scenario():
+        await cache.put("dns", "example.com", {"resolvable": False}, 60)
+        first = await cache.get("dns", "example.com")
+        first["mutated"] = True
+        return await cache.get("dns", "example.com")
+
+    assert asyncio.run(scenario()) == {"resolvable": False}
+
+
+def test_entries_expire_and_zero_ttl_is_not_stored(patched_clock):
+    cache = DomainCache(db_path="")
+
+    async def scenario():
+        await cache.put("dns", "a.com", {"resolvable": True}, 30)
+        await cache.put("dns", "b.com", {"resolvable": True}, 0)
+        fresh = await cache.get("dns", "a.com")
+        patched_clock.advance(31)
+        return fresh, await cache.get("dns", "a.com"), await cache.get("dns", "b.com")
+
+    assert asyncio.run(scenario()) == ({"resolvable": True}, None, None)
+    assert cache.stats["expired"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = DomainCache(maxsize=2, db_path="")
+
+    async def scenario():
+        await cache.put("dns", "a.com", {"n": 1}, 60)
+        await cache.put("dns", "b.com", {"n": 2}, 60)
+        await cache.get("dns", "a.com")
+        await cache.put("dns", "c.com", {"n": 3}, 60)
+        return [await cache.get("dns", name) for name in ("a.com", "b.com", "c.com")]
+
+    assert asyncio.run(scenario()) == [{"n": 1}, None, {"n": 3}]
+    assert cache.stats["evictions"] == 1
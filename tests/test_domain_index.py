@@ -0,0 +1,61 @@
+import pytest
+
+from domain_index import BloomFilter, DomainIndex, build_index
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter.for_capacity(1000)
+    names = [f"name{i}.com" for i in range(1000)]
+    for name in names:
+        bloom.add(name)
+
+    assert all(name in bloom for name in names)
+
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter.for_capacity(2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"taken{i}.com")
+
+    false_positives = sum(f"free{i}.com" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_empty_bloom_filter_contains_nothing():
+    assert "example.com" not in BloomFilter.for_capacity(10)
+
+
+@pytest.fixture
+def index(tmp_path):
+    source = tmp_path / "registered.txt"
+    source.write_text("Example.COM\nzeta.com\nalpha.com.\nmiddle.net\nalpha.com\n", encoding="utf-8")
+    path = str(tmp_path / "registered.idx")
+    build_index(str(source), path)
+    index = DomainIndex(path)
+    yield index
+    index.close()
+
+
+def test_build_index_sorts_and_deduplicates(index):
+    assert index.count == 4
+    with open(index.path, encoding="utf-8") as f:
+        assert f.read().split() == ["alpha.com", "example.com", "middle.net", "zeta.com"]
+    assert index.tlds == {"com", "net"}
+
+
+@pytest.mark.parametrize("name", ["alpha.com", "example.com", "middle.net", "zeta.com"])
+def test_search_finds_every_line(index, name):
+    assert index._search(name.encode("utf-8"))
+
+
+@pytest.mark.parametrize("name", ["a.com", "beta.com", "zzz.com", "alpha.co", "example.comx"])
+def test_search_misses_unlisted_names(index, name):
+    assert not index._search(name.encode("utf-8"))
+
+
+def test_lookups_are_normalized(index):
+    assert "EXAMPLE.com." in index
+    assert " Zeta.COM " in index
+    assert "missing.com" not in index
+    assert index.covers("Other.COM.")
+    assert not index.covers("example.org")
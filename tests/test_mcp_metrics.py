@@ -0,0 +1,52 @@
+from mcp_metrics import LatencyHistogram
+
+
+def test_percentile_of_empty_histogram_is_zero():
+    assert LatencyHistogram().percentile(99) == 0
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for micros in range(1, 101):
+        histogram.record(micros)
+
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(99) == 99
+    assert histogram.percentile(100) == 100
+    assert histogram.count == 100
+    assert histogram.total == sum(range(1, 101))
+
+
+def test_percentile_is_capped_at_max():
+    histogram = LatencyHistogram()
+    histogram.record(1_000_001)
+
+    assert histogram.percentile(50) == 1_000_001
+    assert histogram.max == 1_000_001
+
+
+def test_bucket_bounds_stay_within_relative_precision():
+    histogram = LatencyHistogram()
+    for micros in (65, 1_000, 12_345, 999_999, 7_654_321, 2 ** 40 + 1):
+        upper = histogram._upper_bound(histogram._index(micros))
+        assert micros <= upper <= micros * (1 + 2 ** -LatencyHistogram.SUB_BITS)
+
+
+def test_percentile_picks_the_right_bucket():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(1_000)
+    for _ in range(10):
+        histogram.record(50_000)
+
+    assert 1_000 <= histogram.percentile(90) <= 1_000 * 1.04
+    assert histogram.percentile(91) >= 50_000
+    assert histogram.percentile(99) == 50_000
+
+
+def test_negative_values_count_as_zero():
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+
+    assert histogram.percentile(50) == 0
+    assert histogram.total == 0
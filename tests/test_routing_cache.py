@@ -0,0 +1,53 @@
+import pytest
+
+
+@pytest.fixture
+def make_cache(skill_router, clock, monkeypatch):
+    monkeypatch.setattr(skill_router.time, "monotonic", clock)
+    return skill_router.RoutingCache
+
+
+def test_key_is_normalized(skill_router):
+    make_key = skill_router.RoutingCache.make_key
+    assert make_key("  Erstelle   eine PRÄSENTATION ") == make_key("erstelle eine praesentation")
+    assert make_key("x", output="json") != make_key("x")
+
+
+def test_entries_expire_after_ttl(make_cache, clock):
+    cache = make_cache(maxsize=10, ttl=60)
+    cache.put(("a",), "v1", "result")
+
+    clock.advance(59)
+    assert cache.get(("a",), "v1") == "result"
+    clock.advance(2)
+    assert cache.get(("a",), "v1") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(make_cache):
+    cache = make_cache(maxsize=2, ttl=60)
+    cache.put(("a",), "v1", 1)
+    cache.put(("b",), "v1", 2)
+    assert cache.get(("a",), "v1") == 1
+
+    cache.put(("c",), "v1", 3)
+
+    assert cache.get(("b",), "v1") is None
+    assert cache.get(("a",), "v1") == 1
+    assert cache.get(("c",), "v1") == 3
+    assert cache.evictions == 1
+
+
+def test_catalogue_version_change_drops_all_entries(make_cache):
+    cache = make_cache(maxsize=10, ttl=60)
+    cache.put(("a",), "v1", 1)
+
+    assert cache.get(("a",), "v2") is None
+    assert cache.get(("a",), "v1") is None
+    assert cache.invalidations == 1
+
+
+def test_size_zero_disables_cache(make_cache):
+    cache = make_cache(maxsize=0, ttl=60)
+    cache.put(("a",), "v1", 1)
+    assert cache.get(("a",), "v1") is None
@@ -0,0 +1,77 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from typeql_builder import Statement, batched_queries, literal
+
+
+def test_literal_escapes_quotes_and_backslashes():
+    assert literal('Sag "Hallo"') == '"Sag \\"Hallo\\""'
+    assert literal("C:\\temp") == '"C:\\\\temp"'
+    assert literal('\\"') == '"\\\\\\""'
+
+
+def test_literal_keeps_newlines():
+    assert literal("a\nb") == '"a\nb"'
+
+
+def test_literal_scalars():
+    assert literal(True) == "true"
+    assert literal(False) == "false"
+    assert literal(42) == "42"
+    assert literal(0.5) == "0.5"
+    assert literal(1e-7) == "0.0000001"
+    assert literal(1e20) == "100000000000000000000.0"
+
+
+def test_literal_dates():
+    assert literal(date(2024, 3, 1)) == "2024-03-01"
+    assert literal(datetime(2024, 3, 1, 12, 30, 5, 123456)) == "2024-03-01T12:30:05.123"
+    berlin = timezone(timedelta(hours=1))
+    assert literal(datetime(2024, 3, 1, 13, 0, tzinfo=berlin)) == "2024-03-01T12:00:00.000"
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_literal_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        literal(value)
+
+
+def test_literal_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        literal(None)
+
+
+SEGMENT = Statement('$s isa segment, has text {text};')
+LINKED = Statement('$x isa link, has name {name};', match='$p isa person, has name {name};')
+
+
+def test_batched_queries_splits_at_batch_size():
+    statements = [SEGMENT.bind(i, text=f"t{i}") for i in range(5)]
+    queries = list(batched_queries(statements, batch_size=2))
+
+    assert len(queries) == 3
+    assert queries[0] == 'insert\n$s0 isa segment, has text "t0";\n$s1 isa segment, has text "t1";'
+    assert queries[2] == 'insert\n$s4 isa segment, has text "t4";'
+
+
+def test_batched_queries_repeats_shared_match_per_query():
+    match = '$t isa transcription, has id "t1";'
+    queries = list(batched_queries([SEGMENT.bind(i, text="x") for i in range(3)], match=match, batch_size=2))
+
+    assert len(queries) == 2
+    assert all(query.startswith("match\n" + match + "\ninsert\n") for query in queries)
+
+
+def test_batched_queries_gives_statements_with_match_their_own_query():
+    statements = [SEGMENT.bind(0, text="a"), LINKED.bind(1, name="Ann"), SEGMENT.bind(2, text="b")]
+    queries = list(batched_queries(statements, batch_size=10))
+
+    assert queries == [
+        'match\n$p1 isa person, has name "Ann";\ninsert\n$x1 isa link, has name "Ann";',
+        'insert\n$s0 isa segment, has text "a";\n$s2 isa segment, has text "b";',
+    ]
+
+
+def test_batched_queries_empty_input():
+    assert list(batched_queries([])) == []
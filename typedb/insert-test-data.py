@@ -6,6 +6,7 @@ Erstellt Sample-Meetings, Personen und Teilnehmer
 from typedb.driver import SessionType, TransactionType
 from datetime import datetime
 from typedb_config import get_typedb_driver, DATABASE_NAME, print_config
+from typeql_builder import AGENDA_ITEM_INSERT, MEETING_MATCH, PARTICIPATION, PERSON_DETAILS_INSERT, batched_queries
 
 def insert_test_data():
     print("=" * 60)
@@ -50,17 +51,19 @@ def insert_test_data():
                         }
                     ]
 
-                    for p in persons:
-                        query = f'''
-                            insert
-                            $p isa person,
-                                has person-id "{p["id"]}",
-                                has name "{p["name"]}",
-                                has email "{p["email"]}",
-                                has phone-number "{p["phone"]}",
-                                has person-role "{p["role"]}",
-                                has department "{p["dept"]}";
-                        '''
+                    statements = (
+                        PERSON_DETAILS_INSERT.bind(
+                            i,
+                            person_id=p["id"],
+                            name=p["name"],
+                            email=p["email"],
+                            phone=p["phone"],
+                            role=p["role"],
+                            department=p["dept"]
+                        )
+                        for i, p in enumerate(persons)
+                    )
+                    for query in batched_queries(statements):
                         tx.query.insert(query)
 
                     tx.commit()
@@ -92,15 +95,11 @@ def insert_test_data():
                         {"person": "P-003", "attendance": "tentative"}
                     ]
 
-                    for part in participants:
-                        query = f'''
-                            match
-                            $m isa meeting, has meeting-id "M-001";
-                            $p isa person, has person-id "{part["person"]}";
-                            insert
-                            (meeting: $m, participant: $p) isa meeting-participation,
-                                has attendance-status "{part["attendance"]}";
-                        '''
+                    statements = (
+                        PARTICIPATION.bind(i, person_id=part["person"], attendance=part["attendance"])
+                        for i, part in enumerate(participants)
+                    )
+                    for query in batched_queries(statements, MEETING_MATCH.bind(meeting_id="M-001")):
                         tx.query.insert(query)
 
                     tx.commit()
@@ -126,16 +125,18 @@ def insert_test_data():
                         }
                     ]
 
-                    for ai in agenda_items:
-                        query = f'''
-                            insert
-                            $ai isa agenda-item,
-                                has agenda-item-id "{ai["id"]}",
-                                has title "{ai["title"]}",
-                                has description "{ai["description"]}",
-                                has priority {ai["priority"]},
-                                has estimated-duration {ai["duration"]};
-                        '''
+                    statements = (
+                        AGENDA_ITEM_INSERT.bind(
+                            i,
+                            item_id=ai["id"],
+                            title=ai["title"],
+                            description=ai["description"],
+                            priority=ai["priority"],
+                            duration=ai["duration"]
+                        )
+                        for i, ai in enumerate(agenda_items)
+                    )
+                    for query in batched_queries(statements):
                         tx.query.insert(query)
 
                     tx.commit()
@@ -1,8 +1,14 @@
 """
 TypeDB Initial-Daten Loader - Gemeindeverwaltung Meeting System
 """
+from datetime import datetime
+
 from typedb.driver import SessionType, TransactionType
 from typedb_config import get_typedb_driver, DATABASE_NAME, print_config
+from typeql_builder import (
+    AGENDA_ITEM_INSERT, AGENDA_LINK, MEETING_INSERT, MEETING_MATCH, PARTICIPATION, PERSON_DETAILS_INSERT,
+    batched_queries
+)
 
 def load_initial_data():
     print("=" * 70)
@@ -28,8 +34,12 @@ def load_initial_data():
                         {"id": "P-006", "name": "Hans Fischer", "email": "hans.fischer@gemeinde.ch", "phone": "+41 31 123 4506", "role": "Gemeindeschreiber", "dept": "Verwaltung"},
                         {"id": "P-007", "name": "Sarah Steiner", "email": "sarah.steiner@gemeinde.ch", "phone": "+41 31 123 4507", "role": "Protokollfuehrerin", "dept": "Verwaltung"}
                     ]
-                    for p in persons:
-                        query = f'insert $p isa person, has person-id "{p["id"]}", has name "{p["name"]}", has email "{p["email"]}", has phone-number "{p["phone"]}", has person-role "{p["role"]}", has department "{p["dept"]}";'
+                    statements = (
+                        PERSON_DETAILS_INSERT.bind(i, person_id=p["id"], name=p["name"], email=p["email"],
+                                                   phone=p["phone"], role=p["role"], department=p["dept"])
+                        for i, p in enumerate(persons)
+                    )
+                    for query in batched_queries(statements):
                         tx.query.insert(query)
                     tx.commit()
                     print(f"   ✅ {len(persons)} Personen")
@@ -42,8 +52,13 @@ def load_initial_data():
                         {"id": "M-2025-002", "title": "Budgetsitzung 2026", "status": "scheduled", "start": "2025-12-05T09:00:00", "end": "2025-12-05T12:00:00", "location": "Rathaus Sitzungszimmer 1"},
                         {"id": "M-2025-003", "title": "Ausschusssitzung Bau", "status": "scheduled", "start": "2025-11-25T10:00:00", "end": "2025-11-25T11:30:00", "location": "Bauamt"}
                     ]
-                    for m in meetings:
-                        query = f'insert $m isa meeting, has meeting-id "{m["id"]}", has title "{m["title"]}", has status "{m["status"]}", has start-time {m["start"]}, has end-time {m["end"]}, has location "{m["location"]}";'
+                    statements = (
+                        MEETING_INSERT.bind(i, meeting_id=m["id"], title=m["title"], status=m["status"],
+                                            start_time=datetime.fromisoformat(m["start"]),
+                                            end_time=datetime.fromisoformat(m["end"]), location=m["location"])
+                        for i, m in enumerate(meetings)
+                    )
+                    for query in batched_queries(statements):
                         tx.query.insert(query)
                     tx.commit()
                     print(f"   ✅ {len(meetings)} Meetings")
@@ -51,8 +66,11 @@ def load_initial_data():
                 # 3. Teilnehmer
                 print("\n📋 Teilnehmer...")
                 with session.transaction(TransactionType.WRITE) as tx:
-                    for pid in ["P-001", "P-002", "P-003", "P-004", "P-005", "P-006", "P-007"]:
-                        query = f'match $m isa meeting, has meeting-id "M-2025-001"; $p isa person, has person-id "{pid}"; insert (meeting: $m, participant: $p) isa meeting-participation, has attendance-status "confirmed";'
+                    statements = (
+                        PARTICIPATION.bind(i, person_id=pid, attendance="confirmed")
+                        for i, pid in enumerate(["P-001", "P-002", "P-003", "P-004", "P-005", "P-006", "P-007"])
+                    )
+                    for query in batched_queries(statements, MEETING_MATCH.bind(meeting_id="M-2025-001")):
                         tx.query.insert(query)
                     tx.commit()
                     print("   ✅ 7 Teilnehmer")
@@ -66,8 +84,12 @@ def load_initial_data():
                         {"id": "AI-003", "title": "Baugesuch Hauptstrasse 45", "desc": "Neubau 6 Wohnungen", "prio": 8.0, "dur": 30.0},
                         {"id": "AI-004", "title": "Budget 2026", "desc": "Erste Lesung", "prio": 10.0, "dur": 60.0}
                     ]
-                    for ai in agenda:
-                        query = f'insert $ai isa agenda-item, has agenda-item-id "{ai["id"]}", has title "{ai["title"]}", has description "{ai["desc"]}", has priority {ai["prio"]}, has estimated-duration {ai["dur"]};'
+                    statements = (
+                        AGENDA_ITEM_INSERT.bind(i, item_id=ai["id"], title=ai["title"], description=ai["desc"],
+                                                priority=ai["prio"], duration=ai["dur"])
+                        for i, ai in enumerate(agenda)
+                    )
+                    for query in batched_queries(statements):
                         tx.query.insert(query)
                     tx.commit()
                     print(f"   ✅ {len(agenda)} Agenda Items")
@@ -75,8 +97,11 @@ def load_initial_data():
                 # 5. Verknüpfe
                 print("\n📋 Verknuepfe Agenda...")
                 with session.transaction(TransactionType.WRITE) as tx:
-                    for i, aid in enumerate(["AI-001", "AI-002", "AI-003", "AI-004"], 1):
-                        query = f'match $m isa meeting, has meeting-id "M-2025-001"; $ai isa agenda-item, has agenda-item-id "{aid}"; insert (meeting: $m, item: $ai) isa meeting-agenda, has agenda-order {float(i)};'
+                    statements = (
+                        AGENDA_LINK.bind(i, item_id=aid, order=float(i))
+                        for i, aid in enumerate(["AI-001", "AI-002", "AI-003", "AI-004"], 1)
+                    )
+                    for query in batched_queries(statements, MEETING_MATCH.bind(meeting_id="M-2025-001")):
                         tx.query.insert(query)
                     tx.commit()
                     print("   ✅ Verknuepft")
@@ -4,13 +4,12 @@ Lädt Schema und Rules auf TypeDB Server 138.197.190.64:8000
 Database: meeting-knowledge
 """
 
-from typedb.driver import TypeDB, SessionType, TransactionType
+from typedb.driver import SessionType, TransactionType
 import os
 from pathlib import Path
+from typedb_config import get_typedb_driver, invalidate_sessions, DATABASE_NAME, TYPEDB_SERVER
 
-# Konfiguration
-TYPEDB_SERVER = "138.197.190.64:1729"  # TypeDB Server Port (nicht Studio Port 8000)
-DATABASE_NAME = "meeting-knowledge"
+# Konfiguration (Server und Database aus typedb_config / .env; TypeDB Server Port, nicht Studio Port 8000)
 SCHEMA_DIR = Path(__file__).parent / "schemas"
 
 def load_schema_file(session, filepath, description):
@@ -60,7 +59,7 @@ def setup_meeting_schema():
     try:
         # Verbindung zum TypeDB Server
         print("\n🔌 Verbinde zu TypeDB Server...")
-        with TypeDB.core_driver(TYPEDB_SERVER) as driver:
+        with get_typedb_driver() as driver:
 
             # Prüfe ob Database existiert
             if driver.databases.contains(DATABASE_NAME):
@@ -74,6 +73,7 @@ def setup_meeting_schema():
 
                 if choice == '1':
                     print(f"\n🗑️  Lösche Database '{DATABASE_NAME}'...")
+                    invalidate_sessions(DATABASE_NAME)
                     driver.databases.get(DATABASE_NAME).delete()
                     print(f"✅ Database gelöscht!")
                     driver.databases.create(DATABASE_NAME)
@@ -154,7 +154,7 @@ def verify_schema():
     print("=" * 60)
 
     try:
-        with TypeDB.core_driver(TYPEDB_SERVER) as driver:
+        with get_typedb_driver() as driver:
             with driver.session(DATABASE_NAME, SessionType.SCHEMA) as session:
                 with session.transaction(TransactionType.READ) as tx:
 
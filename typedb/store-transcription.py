@@ -1,16 +1,354 @@
 """
 Store Swiss Transcription in TypeDB
 Speichert Transkriptionen mit Topics und Entitäten
+
+Aufruf:
+    python store-transcription.py '<json_data>'          # eine Transkription pro Prozess
+    python store-transcription.py --worker               # NDJSON über stdin, Ergebnisse als NDJSON auf stdout
+    python store-transcription.py --socket <pfad>        # NDJSON über Unix-Socket (mehrere Clients)
+    python store-transcription.py --stream               # stdin: Kopfzeile (JSON), danach ein Segment pro Zeile
+    python store-transcription.py --read-segments <transcription_id> [von] [bis]
+
+Im Worker-Modus bleiben Driver und DATA-Session offen; pro Eingabezeile
+wird eine Ergebniszeile geschrieben (gleiche Reihenfolge, gleiches Format
+wie beim Einzelaufruf). Statusmeldungen gehen dann auf stderr.
+
+Segmente ({start, end, text}, Zeiten in Sekunden) werden als eigene
+transcript-segment Entities gespeichert statt als ein full-text String;
+im --stream Modus wird dabei nie die ganze Aufnahme im Speicher gehalten.
 """
 
+import contextlib
+import itertools
+import os
+import queue
+import socket
 import sys
 import json
+import threading
+from concurrent.futures import Future
 from datetime import datetime
-from typedb.driver import TypeDB, SessionType, TransactionType
+from typedb.driver import SessionType, TransactionType
+from typedb_config import get_typedb_driver, DATABASE_NAME
+from typeql_builder import (
+    PERSON_INSERT, PROTOCOL_INSERT, SEGMENT_INSERT, TOPIC_DISCUSSION, TRANSCRIPTION_HEADER_INSERT,
+    TRANSCRIPTION_INSERT, TRANSCRIPTION_MATCH, TRANSCRIPTION_MEETING_LINK, batched_queries, build_query, literal
+)
+
+# Maximale Anzahl Topics bzw. Personen pro Insert-Query
+INSERT_BATCH_SIZE = int(os.getenv("TYPEDB_INSERT_BATCH_SIZE", "50"))
+
+# Segmente pro Insert-Query und pro Write-Transaktion
+SEGMENT_BATCH_SIZE = int(os.getenv("TYPEDB_SEGMENT_BATCH_SIZE", "100"))
+SEGMENT_TX_SIZE = int(os.getenv("TYPEDB_SEGMENT_TX_SIZE", "1000"))
+
+# Socket-Modus: angenommene, noch nicht geschriebene Transkriptionen (darüber blockieren die Clients)
+WORKER_QUEUE_SIZE = int(os.getenv("TYPEDB_WORKER_QUEUE_SIZE", "16"))
+
+
+def person_id_for(name):
+    return f"person_{name.replace(' ', '_').lower()}"
+
+
+def insert_topics_batched(tx, transcription_id, topics, batch_size=INSERT_BATCH_SIZE):
+    """
+    Speichert Topics als Agenda Items, mehrere pro Query
+
+    Jeder Batch ist eine einzige match-insert Query: die Transkription wird
+    einmal gematcht, danach folgen alle Agenda Items und ihre Relationen.
+    """
+    match = TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)
+    statements = (
+        TOPIC_DISCUSSION.bind(
+            idx,
+            item_id=f"topic_{transcription_id}_{idx}",
+            title=topic.get('title') or 'Unbekannt',
+            description=topic.get('description') or '',
+            priority=float(topic['relevance']) if topic.get('relevance') is not None else 0.5,
+            order_index=idx,
+            status="extracted"
+        )
+        for idx, topic in enumerate(topics)
+    )
+
+    for query in batched_queries(statements, match, batch_size):
+        tx.query.insert(query)
+
+    return len(topics)
+
+
+def fetch_existing_person_ids(tx, person_ids):
+    """Liefert die bereits gespeicherten person-ids aus person_ids (eine Query)"""
+    if not person_ids:
+        return set()
+
+    if len(person_ids) == 1:
+        condition = f"$id == {literal(person_ids[0])};"
+    else:
+        condition = " or ".join(f"{{ $id == {literal(person_id)}; }}" for person_id in person_ids) + ";"
+    query = f"match $person isa person, has person-id $id; {condition} get $id;"
+    return {answer.get("id").as_attribute().get_value() for answer in tx.query.get(query)}
+
+
+def insert_persons_batched(tx, entities, batch_size=INSERT_BATCH_SIZE):
+    """
+    Legt fehlende Personen an und gibt ihre Namen zurück
+
+    Personen werden client-seitig dedupliziert, vorhandene person-ids mit
+    einer einzigen Query geladen und die neuen in Batches eingefügt.
+    """
+    persons = {}
+    for ent in entities:
+        name = ent.get('text', '')
+        if ent.get('type', 'UNKNOWN') == 'PERSON' and name:
+            persons.setdefault(person_id_for(name), name)
+
+    existing = fetch_existing_person_ids(tx, list(persons))
+    new_persons = [(person_id, name) for person_id, name in persons.items() if person_id not in existing]
+
+    statements = (
+        PERSON_INSERT.bind(idx, person_id=person_id, name=name)
+        for idx, (person_id, name) in enumerate(new_persons)
+    )
+    for query in batched_queries(statements, batch_size=batch_size):
+        tx.query.insert(query)
+
+    return [name for _, name in new_persons]
+
+
+def parse_segment(idx, segment):
+    """Prüft ein Segment und liefert (start, end, text); ValueError mit Segment-Nummer bei Fehlern"""
+    try:
+        start = float(segment['start'])
+        end = float(segment.get('end', start))
+        text = segment.get('text', '')
+    except (KeyError, TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f"Segment {idx} ungültig ({e!r}): {segment!r}") from None
+    if not isinstance(text, str):
+        raise ValueError(f"Segment {idx}: text muss ein String sein")
+    if end < start:
+        raise ValueError(f"Segment {idx}: end ({end}) liegt vor start ({start})")
+    return start, end, text
+
+
+def segment_statements(transcription_id, segments, offset=0):
+    """Gebundene Segment-Statements; offset ist der order-index des ersten Segments"""
+    for idx, segment in enumerate(segments, offset):
+        start, end, text = parse_segment(idx, segment)
+        yield SEGMENT_INSERT.bind(
+            idx,
+            segment_id=f"seg_{transcription_id}_{idx}",
+            text=text,
+            order_index=float(idx),
+            start=start,
+            end=end
+        )
+
+
+def store_segments(session, transcription_id, segments, batch_size=SEGMENT_BATCH_SIZE, tx_size=SEGMENT_TX_SIZE):
+    """
+    Schreibt Segmente aus einem beliebigen Iterable (auch Generator) gestreamt
+
+    Pro tx_size Segmente eine eigene Write-Transaktion mit Queries zu je
+    batch_size Segmenten; im Speicher liegt nie mehr als ein Chunk. Die
+    Transkription muss bereits committed sein. Bricht eine Transaktion ab,
+    bleiben die vorher committeten Chunks gespeichert (siehe
+    store_transcription_segments für das Aufräumen).
+
+    Returns:
+        Anzahl gespeicherter Segmente
+    """
+    match = TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)
+    segments = iter(segments)
+    count = 0
+
+    while True:
+        chunk = list(itertools.islice(segments, tx_size))
+        if not chunk:
+            return count
+
+        with session.transaction(TransactionType.WRITE) as tx:
+            for query in batched_queries(segment_statements(transcription_id, chunk, count), match, batch_size):
+                tx.query.insert(query)
+            tx.commit()
+        count += len(chunk)
+
+
+def delete_transcription_segments(session, transcription_id):
+    """Löscht eine Transkription samt ihrer Segmente (Rollback von store_transcription_segments)"""
+    match = f"match {TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)}"
+    with session.transaction(TransactionType.WRITE) as tx:
+        tx.query.delete(
+            f"{match} (transcription: $transcription, segment: $segment) isa transcription-segment;"
+            " delete $segment isa transcript-segment;"
+        )
+        tx.query.delete(f"{match} delete $transcription isa transcription;")
+        tx.commit()
+
+
+def store_transcription_segments(session, transcription_id, language, segments):
+    """
+    Legt die Transkription (ohne full-text) an und schreibt ihre Segmente
+
+    Listen werden vollständig geprüft, bevor etwas geschrieben wird. Bei
+    Streams (Generatoren) fällt ein fehlerhaftes Segment erst beim Schreiben
+    auf; dann werden Transkription und bereits geschriebene Segmente wieder
+    gelöscht und der Fehler weitergegeben.
+
+    Returns:
+        Anzahl gespeicherter Segmente
+    """
+    if isinstance(segments, (list, tuple)):
+        for idx, segment in enumerate(segments):
+            parse_segment(idx, segment)
+
+    with session.transaction(TransactionType.WRITE) as tx:
+        tx.query.insert(build_query([TRANSCRIPTION_HEADER_INSERT.bind(
+            transcription_id=transcription_id,
+            language=language,
+            created_at=datetime.now()
+        )]))
+        tx.commit()
+
+    try:
+        return store_segments(session, transcription_id, segments)
+    except Exception:
+        print(f"  ↩️  Segmente fehlerhaft, entferne Transkription {transcription_id}")
+        delete_transcription_segments(session, transcription_id)
+        raise
+
+
+def read_segments(session, transcription_id, start=None, end=None):
+    """
+    Liefert die Segmente einer Transkription, die das Zeitfenster [start, end) überlappen
+
+    Gefiltert und sortiert wird in TypeDB; es wird nur der angefragte
+    Ausschnitt übertragen, nicht der ganze Text.
+    """
+    conditions = ""
+    if start is not None:
+        conditions += f" $end > {literal(float(start))};"
+    if end is not None:
+        conditions += f" $start < {literal(float(end))};"
+
+    query = (
+        f"match {TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)}"
+        " (transcription: $transcription, segment: $segment) isa transcription-segment;"
+        " $segment has order-index $order, has timestamp-in-recording $start,"
+        f" has segment-end $end, has segment-text $text;{conditions}"
+        " get $order, $start, $end, $text; sort $order;"
+    )
+
+    with session.transaction(TransactionType.READ) as tx:
+        for answer in tx.query.get(query):
+            yield {
+                'start': answer.get("start").as_attribute().get_value(),
+                'end': answer.get("end").as_attribute().get_value(),
+                'text': answer.get("text").as_attribute().get_value()
+            }
+
+
+def write_transcription(session, data):
+    """
+    Schreibt eine Transkription in einer Write-Transaktion der offenen DATA-Session
+
+    Args:
+        session: offene DATA-Session (wird nicht geschlossen)
+        data: bereits geparstes Transkriptions-Dict (Felder siehe store_transcription);
+              'segments' darf ein Generator sein
+
+    Mit Segmenten werden Transkription und Segmente zuerst geschrieben (und
+    bei einem fehlerhaften Segment wieder entfernt), danach alles Übrige in
+    einer Transaktion.
+    """
+    transcription_id = data['transcription_id']
+    language = data.get('language', 'de-CH')
+    segments = data.get('segments')
+    segments_count = None
+
+    if segments is not None:
+        # 0. Transkription ohne full-text plus Segmente
+        segments_count = store_transcription_segments(session, transcription_id, language, segments)
+        print(f"  🧩 {segments_count} Segmente gespeichert")
+
+    try:
+        with session.transaction(TransactionType.WRITE) as tx:
+
+            # 1. Create Transcription entity
+            if segments is None:
+                query_transcription = build_query([TRANSCRIPTION_INSERT.bind(
+                    transcription_id=transcription_id,
+                    full_text=data['full_text'],
+                    language=language,
+                    created_at=datetime.now()
+                )])
+                tx.query.insert(query_transcription)
+
+            # Optional: Link to meeting if meeting_id provided
+            if 'meeting_id' in data and data['meeting_id']:
+                meeting_id = data['meeting_id']
+                query_meeting_link = build_query(
+                    [TRANSCRIPTION_MEETING_LINK.bind(meeting_id=meeting_id)],
+                    TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)
+                )
+                tx.query.insert(query_meeting_link)
+
+            print("  ✅ Transkription Entity erstellt")
+
+            # 2. Create Protocol if provided
+            if 'protocol' in data and data['protocol']:
+                protocol_id = f"prot_{transcription_id}"
+                protocol_content = data['protocol']
+
+                query_protocol = build_query(
+                    [PROTOCOL_INSERT.bind(protocol_id=protocol_id, content=protocol_content, created_at=datetime.now())],
+                    TRANSCRIPTION_MATCH.bind(transcription_id=transcription_id)
+                )
+
+                tx.query.insert(query_protocol)
+                print("  ✅ Protokoll Entity erstellt")
+
+            # 3. Store Topics as Agenda Items (gebündelt, ein match pro Batch)
+            topics = data.get('topics', [])
+            print(f"  📋 Speichere {len(topics)} Topics...")
+
+            insert_topics_batched(tx, transcription_id, topics)
+            for idx, topic in enumerate(topics):
+                print(f"    - Topic {idx+1}: {topic.get('title') or 'Unbekannt'}")
+
+            # 4. Store Entities as Person references (dedupliziert, eine Existenz-Query)
+            entities = data.get('entities', [])
+            if entities:
+                print(f"  👥 Speichere {len(entities)} Entitäten...")
+
+                for name in insert_persons_batched(tx, entities):
+                    print(f"    - Person erstellt: {name}")
+
+            # Commit transaction
+            tx.commit()
+    except Exception:
+        if segments_count is not None:
+            # Transkription und Segmente stehen schon in der DB, sonst bliebe ein Fragment zurück
+            print(f"  ↩️  Entferne Transkription {transcription_id}")
+            delete_transcription_segments(session, transcription_id)
+        raise
+
+    result = {
+        'success': True,
+        'transcription_id': transcription_id,
+        'topics_count': len(topics),
+        'entities_count': len(entities)
+    }
+    if segments_count is not None:
+        result['segments_count'] = segments_count
+
+    print("✅ Transkription erfolgreich in TypeDB gespeichert!")
+    print(f"   - Transcription ID: {transcription_id}")
+    print(f"   - Topics: {len(topics)}")
+    print(f"   - Entities: {len(entities)}")
+
+    return result
 
-# Konfiguration
-TYPEDB_SERVER = "138.197.190.64:1729"
-DATABASE_NAME = "meeting-knowledge"
 
 def store_transcription(transcription_data):
     """
@@ -20,14 +358,13 @@ def store_transcription(transcription_data):
         transcription_data: JSON string mit:
             - transcription_id
             - meeting_id (optional)
-            - full_text
+            - full_text (entfällt bei segments)
+            - segments: [{start, end, text}] (optional, statt full_text)
             - language
-            - duration_seconds
-            - recorded_at
             - topics: [{title, description, relevance, keywords, category}]
             - entities: [{text, type, context}]
             - protocol (optional)
-            - summary (optional)
+            - duration_seconds, recorded_at, summary (optional, derzeit nicht gespeichert)
     """
 
     try:
@@ -36,155 +373,9 @@ def store_transcription(transcription_data):
 
         print(f"📥 Speichere Transkription: {data.get('transcription_id', 'unknown')}")
 
-        with TypeDB.core_driver(TYPEDB_SERVER) as driver:
+        with get_typedb_driver() as driver:
             with driver.session(DATABASE_NAME, SessionType.DATA) as session:
-                with session.transaction(TransactionType.WRITE) as tx:
-
-                    # 1. Create Transcription entity
-                    transcription_id = data['transcription_id']
-                    full_text = data['full_text']
-                    language = data.get('language', 'de-CH')
-
-                    query_transcription = f'''
-                        insert $transcription isa transcription,
-                            has transcription-id "{transcription_id}",
-                            has full-text """{full_text}""",
-                            has language "{language}",
-                            has created-at {datetime.now().isoformat()};
-                    '''
-
-                    # Optional: Link to meeting if meeting_id provided
-                    if 'meeting_id' in data and data['meeting_id']:
-                        meeting_id = data['meeting_id']
-                        query_transcription += f'''
-                        match $meeting isa meeting, has meeting-id "{meeting_id}";
-                        insert (recorded-meeting: $meeting, meeting-transcription: $transcription)
-                            isa transcription-of-meeting;
-                        '''
-
-                    print("  ✅ Transkription Entity erstellt")
-
-                    # 2. Create Recording if duration provided
-                    if 'duration_seconds' in data:
-                        recording_id = f"rec_{transcription_id}"
-                        duration = data['duration_seconds']
-                        recorded_at = data.get('recorded_at', datetime.now().isoformat())
-
-                        query_recording = f'''
-                            insert $recording isa recording,
-                                has recording-id "{recording_id}",
-                                has duration-seconds {duration},
-                                has recorded-at {recorded_at},
-                                has transcription-status "completed";
-                        '''
-
-                        print("  ✅ Recording Entity erstellt")
-
-                    # 3. Create Protocol if provided
-                    if 'protocol' in data and data['protocol']:
-                        protocol_id = f"prot_{transcription_id}"
-                        protocol_content = data['protocol']
-
-                        query_protocol = f'''
-                            insert $protocol isa protocol,
-                                has protocol-id "{protocol_id}",
-                                has content-markdown """{protocol_content}""",
-                                has created-at {datetime.now().isoformat()};
-
-                            match $transcription isa transcription,
-                                  has transcription-id "{transcription_id}";
-                            insert (source-transcription: $transcription, generated-protocol: $protocol)
-                                isa protocol-generation;
-                        '''
-
-                        tx.query.insert(query_protocol)
-                        print("  ✅ Protokoll Entity erstellt")
-
-                    # 4. Store Topics as Agenda Items
-                    topics = data.get('topics', [])
-                    print(f"  📋 Speichere {len(topics)} Topics...")
-
-                    for idx, topic in enumerate(topics):
-                        topic_id = f"topic_{transcription_id}_{idx}"
-                        title = topic.get('title', 'Unbekannt')
-                        description = topic.get('description', '')
-                        relevance = topic.get('relevance', 0.5)
-                        category = topic.get('category', 'Anderes')
-                        keywords = topic.get('keywords', [])
-
-                        query_topic = f'''
-                            insert $topic isa agenda-item,
-                                has item-id "{topic_id}",
-                                has topic "{title}",
-                                has description "{description}",
-                                has priority {relevance},
-                                has order-index {idx},
-                                has status "extracted";
-
-                            match $transcription isa transcription,
-                                  has transcription-id "{transcription_id}";
-                            insert (discussed-in: $transcription, agenda-topic: $topic)
-                                isa topic-discussion;
-                        '''
-
-                        tx.query.insert(query_topic)
-                        print(f"    - Topic {idx+1}: {title}")
-
-                    # 5. Store Entities as Person/Organization references
-                    entities = data.get('entities', [])
-                    if entities:
-                        print(f"  👥 Speichere {len(entities)} Entitäten...")
-
-                        for ent in entities:
-                            ent_text = ent.get('text', '')
-                            ent_type = ent.get('type', 'UNKNOWN')
-                            ent_context = ent.get('context', '')
-
-                            if ent_type == 'PERSON':
-                                # Check if person exists, otherwise create
-                                person_id = f"person_{ent_text.replace(' ', '_').lower()}"
-
-                                query_entity = f'''
-                                    match $person isa person, has person-id "{person_id}";
-                                    get $person;
-                                '''
-
-                                existing = list(tx.query.get(query_entity))
-
-                                if not existing:
-                                    query_insert_person = f'''
-                                        insert $person isa person,
-                                            has person-id "{person_id}",
-                                            has name "{ent_text}";
-                                    '''
-                                    tx.query.insert(query_insert_person)
-                                    print(f"    - Person erstellt: {ent_text}")
-
-                    # 6. Store summary if provided
-                    if 'summary' in data and data['summary']:
-                        # Add summary as attribute to transcription
-                        summary_text = data['summary']
-                        query_summary = f'''
-                            match $transcription isa transcription,
-                                  has transcription-id "{transcription_id}";
-                            insert $transcription has description "{summary_text}";
-                        '''
-                        # Note: Schema might need adjustment to allow description on transcription
-
-                    # Commit transaction
-                    tx.commit()
-
-                    print("✅ Transkription erfolgreich in TypeDB gespeichert!")
-                    print(f"   - Transcription ID: {transcription_id}")
-                    print(f"   - Topics: {len(topics)}")
-                    print(f"   - Entities: {len(entities)}")
-
-                    return {
-                        'success': True,
-                        'transcription_id': transcription_id,
-                        'topics_count': len(topics),
-                        'entities_count': len(entities)
-                    }
+                return write_transcription(session, data)
 
     except json.JSONDecodeError as e:
         print(f"❌ JSON Parse Error: {e}")
@@ -195,9 +386,182 @@ def store_transcription(transcription_data):
         return {'success': False, 'error': str(e)}
 
 
+def stream_transcription(lines):
+    """
+    Speichert eine Transkription aus einem Zeilen-Stream
+
+    Erste Zeile: Transkriptions-JSON ohne full_text/segments, jede weitere
+    Zeile ein Segment-JSON. Die Segmente werden beim Schreiben gelesen.
+    """
+    lines = iter(lines)
+    try:
+        data = json.loads(next(lines))
+    except StopIteration:
+        return {'success': False, 'error': 'Keine Eingabe'}
+    except json.JSONDecodeError as e:
+        return {'success': False, 'error': f'Invalid JSON: {e}'}
+
+    data['segments'] = (json.loads(line) for line in lines if line.strip())
+    print(f"📥 Speichere Transkription (Stream): {data.get('transcription_id', 'unknown')}")
+
+    try:
+        with get_typedb_driver() as driver:
+            with driver.session(DATABASE_NAME, SessionType.DATA) as session:
+                return write_transcription(session, data)
+    except json.JSONDecodeError as e:
+        print(f"❌ JSON Parse Error: {e}")
+        return {'success': False, 'transcription_id': data.get('transcription_id'), 'error': f'Invalid JSON: {e}'}
+    except Exception as e:
+        print(f"❌ TypeDB Error: {e}")
+        return {'success': False, 'transcription_id': data.get('transcription_id'), 'error': str(e)}
+
+
+class IngestionWorker:
+    """
+    Langlebiger Writer: eine DATA-Session (aus dem typedb_config Pool) für alle Transkriptionen
+
+    Schlägt ein Schreibvorgang fehl, wird die Session verworfen und beim
+    nächsten Eintrag neu geöffnet.
+    """
+
+    def __init__(self):
+        self.session = None
+        self.processed = 0
+
+    def _ensure_session(self):
+        if self.session is None or not self.session.is_open():
+            self.close(discard=True)
+            self.session = get_typedb_driver().session(DATABASE_NAME, SessionType.DATA)
+
+    def close(self, discard=False):
+        if self.session is not None:
+            with contextlib.suppress(Exception):
+                if discard:
+                    self.session.discard()
+                else:
+                    self.session.close()
+        self.session = None
+
+    def handle(self, line):
+        """Schreibt eine NDJSON-Zeile und liefert das Ergebnis-Dict"""
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {'success': False, 'error': f'Invalid JSON: {e}'}
+
+        self.processed += 1
+        try:
+            self._ensure_session()
+            # stdout ist der Ergebniskanal, Statusmeldungen gehen auf stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                print(f"📥 Speichere Transkription: {data.get('transcription_id', 'unknown')}")
+                return write_transcription(self.session, data)
+        except Exception as e:
+            print(f"❌ TypeDB Error: {e}", file=sys.stderr)
+            self.close(discard=True)
+            transcription_id = data.get('transcription_id') if isinstance(data, dict) else None
+            return {'success': False, 'transcription_id': transcription_id, 'error': str(e)}
+
+    def serve_stdin(self):
+        """
+        Liest Transkriptionen zeilenweise von stdin
+
+        Jede Zeile wird geschrieben, bevor die nächste gelesen wird; ein
+        schneller Produzent wird so über die volle Pipe gebremst.
+        """
+        try:
+            for line in sys.stdin:
+                if line.strip():
+                    sys.stdout.write(json.dumps(self.handle(line), ensure_ascii=False) + "\n")
+                    sys.stdout.flush()
+        finally:
+            self.close()
+
+    def serve_socket(self, path, queue_size=WORKER_QUEUE_SIZE):
+        """
+        Nimmt NDJSON-Verbindungen auf einem Unix-Socket an
+
+        Alle Clients teilen eine begrenzte Warteschlange vor dem einen
+        Writer-Thread: ist sie voll, liest der Server nicht weiter vom
+        Socket und die Clients werden gebremst. Antworten kommen pro
+        Verbindung in Eingabereihenfolge.
+        """
+        work = queue.Queue(maxsize=queue_size)
+
+        def writer():
+            while True:
+                line, future = work.get()
+                future.set_result(self.handle(line))
+
+        def client(conn):
+            pending = queue.Queue()
+
+            def reply():
+                with conn.makefile("w", encoding="utf-8") as out:
+                    while True:
+                        future = pending.get()
+                        if future is None:
+                            return
+                        out.write(json.dumps(future.result(), ensure_ascii=False) + "\n")
+                        out.flush()
+
+            replier = threading.Thread(target=reply, daemon=True)
+            replier.start()
+            with conn, conn.makefile("r", encoding="utf-8") as lines:
+                for line in lines:
+                    if line.strip():
+                        future = Future()
+                        pending.put(future)
+                        work.put((line, future))
+                pending.put(None)
+                replier.join()
+
+        if os.path.exists(path):
+            os.remove(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen()
+        threading.Thread(target=writer, daemon=True).start()
+        print(f"🚀 Transcription Worker lauscht auf {path}", file=sys.stderr)
+
+        try:
+            while True:
+                conn, _ = server.accept()
+                threading.Thread(target=client, args=(conn,), daemon=True).start()
+        finally:
+            server.close()
+            os.remove(path)
+            self.close()
+
+
 if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--worker":
+        IngestionWorker().serve_stdin()
+        sys.exit(0)
+
+    if len(sys.argv) >= 3 and sys.argv[1] == "--socket":
+        IngestionWorker().serve_socket(sys.argv[2])
+        sys.exit(0)
+
+    if len(sys.argv) >= 2 and sys.argv[1] == "--stream":
+        result = stream_transcription(sys.stdin)
+        print(json.dumps(result))
+        sys.exit(0)
+
+    if len(sys.argv) >= 3 and sys.argv[1] == "--read-segments":
+        bounds = [float(arg) for arg in sys.argv[3:5]]
+        with get_typedb_driver() as driver:
+            with driver.session(DATABASE_NAME, SessionType.DATA) as session:
+                for segment in read_segments(session, sys.argv[2], *bounds):
+                    print(json.dumps(segment, ensure_ascii=False))
+        sys.exit(0)
+
     if len(sys.argv) < 2:
         print("Usage: python store-transcription.py '<json_data>'")
+        print("       python store-transcription.py --worker          (NDJSON über stdin/stdout)")
+        print("       python store-transcription.py --socket <pfad>   (NDJSON über Unix-Socket)")
+        print("       python store-transcription.py --stream          (Kopfzeile + Segmente als NDJSON über stdin)")
+        print("       python store-transcription.py --read-segments <transcription_id> [von] [bis]")
         print("\nExample JSON:")
         print(json.dumps({
             "transcription_id": "trans_12345",
@@ -1,11 +1,24 @@
 """
 TypeDB Configuration Helper
 Lädt Credentials aus .env und erstellt TypeDB Connection
+
+Driver und Sessions werden prozessweit geteilt:
+- get_typedb_driver() liefert immer denselben Driver (neu aufgebaut, falls geschlossen)
+- driver.session(...) liefert Sessions aus einem begrenzten Pool pro Database/SessionType
+- `with`-Blöcke geben Driver und Sessions an den Pool zurück statt sie zu schliessen
+
+Bestehender Code (`with get_typedb_driver() as driver: with driver.session(...)`)
+nutzt den Pool ohne Änderung; mehrere Operationen im selben Prozess sparen
+sich so TCP-Verbindung, Authentifizierung und Session-Aufbau.
 """
 
+import atexit
 import os
+import threading
+import time
+from collections import deque
 from dotenv import load_dotenv
-from typedb.driver import TypeDB, TypeDBCredential
+from typedb.driver import SessionType, TypeDB, TypeDBCredential
 
 # Load environment variables
 load_dotenv()
@@ -16,9 +29,14 @@ DATABASE_NAME = os.getenv("TYPEDB_DATABASE", "meeting-knowledge")
 TYPEDB_USERNAME = os.getenv("TYPEDB_USERNAME")
 TYPEDB_PASSWORD = os.getenv("TYPEDB_PASSWORD")
 
-def get_typedb_driver():
+# Session-Pool: max. offene Sessions pro Database/SessionType und Leerlaufzeit bis zum Schliessen
+TYPEDB_POOL_MAX_SESSIONS = int(os.getenv("TYPEDB_POOL_MAX_SESSIONS", "4"))
+TYPEDB_POOL_IDLE_SECONDS = float(os.getenv("TYPEDB_POOL_IDLE_SECONDS", "300"))
+
+
+def create_typedb_driver():
     """
-    Erstellt TypeDB Driver mit oder ohne Authentifizierung
+    Erstellt einen neuen (nicht geteilten) TypeDB Driver mit oder ohne Authentifizierung
     """
     if TYPEDB_USERNAME and TYPEDB_PASSWORD:
         # Mit Authentifizierung
@@ -32,6 +50,226 @@ def get_typedb_driver():
         # Ohne Authentifizierung (Fallback)
         return TypeDB.core_driver(TYPEDB_SERVER)
 
+
+class PooledSession:
+    """
+    Ausgeliehene Session: verhält sich wie eine TypeDB Session,
+    close() bzw. das Ende des `with`-Blocks gibt sie an den Pool zurück
+    """
+
+    def __init__(self, pool, key, session, reusable=True, owner=None, holds_slot=True):
+        self._pool = pool
+        self._key = key
+        self._session = session
+        self._reusable = reusable
+        self._owner = owner
+        self._holds_slot = holds_slot
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Nach einem Fehler wird die Session nicht wiederverwendet
+        self._release(discard=exc_type is not None)
+
+    def close(self):
+        self._release()
+
+    def discard(self):
+        """Schliesst die Session endgültig (z.B. nach einem Verbindungsfehler)"""
+        self._release(discard=True)
+
+    def _release(self, discard=False):
+        if not self._released:
+            self._released = True
+            self._pool._release(self._key, self._session, discard or not self._reusable,
+                                self._owner, self._holds_slot)
+
+
+class TypeDBPool:
+    """
+    Prozessweiter Driver plus begrenzter Session-Pool
+
+    Pro (Database, SessionType) sind höchstens max_sessions Sessions
+    gleichzeitig offen; weitere Anfragen warten, bis eine zurückkommt.
+    Beim Ausleihen werden geschlossene und zu lange unbenutzte Sessions
+    verworfen (Health-Check und Idle-Eviction). SCHEMA-Sessions blockieren
+    Daten-Schreibzugriffe anderer Clients und werden deshalb nie gepoolt,
+    sondern bei der Rückgabe geschlossen.
+
+    Das Limit gilt pro Thread nur für die äusserste Session: Leiht ein
+    Thread, der schon eine Session desselben Schlüssels hält, eine weitere
+    aus (z.B. eine SCHEMA-Prüfung innerhalb einer offenen Session), wartet
+    er nicht auf einen Slot. Sonst stünde er bei max_sessions=1 auf seinen
+    eigenen Slot an. Verschachtelte Sessions kommen zum Limit hinzu.
+    """
+
+    def __init__(self, max_sessions=TYPEDB_POOL_MAX_SESSIONS, idle_seconds=TYPEDB_POOL_IDLE_SECONDS):
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self._driver = None
+        self._lock = threading.Lock()
+        self._idle = {}        # key -> deque[(session, zuletzt benutzt)]
+        self._slots = {}       # key -> Semaphore (max. offene Sessions)
+        self._held = {}        # (Thread, key) -> Anzahl ausgeliehener Sessions
+        self.stats = {"drivers_created": 0, "sessions_created": 0, "sessions_reused": 0, "sessions_evicted": 0}
+
+    def driver(self):
+        """Geteilter Driver; wird neu aufgebaut, wenn er nicht mehr offen ist"""
+        with self._lock:
+            if self._driver is None or not self._driver.is_open():
+                if self._driver is not None:
+                    self._drop_idle_sessions()
+                self._driver = create_typedb_driver()
+                self.stats["drivers_created"] += 1
+            return self._driver
+
+    def session(self, database, session_type, options=None):
+        key = (database, session_type)
+        owner = (threading.get_ident(), key)
+        with self._lock:
+            slots = self._slots.setdefault(key, threading.BoundedSemaphore(self.max_sessions))
+            holds_slot = not self._held.get(owner)
+        if holds_slot:
+            slots.acquire()
+        with self._lock:
+            self._held[owner] = self._held.get(owner, 0) + 1
+
+        try:
+            self.evict_idle()
+            # Sessions mit eigenen Optionen und SCHEMA-Sessions werden nicht an andere Aufrufer weitergegeben
+            reusable = options is None and session_type != SessionType.SCHEMA
+            session = self._take_idle(key) if reusable else None
+            if session is None:
+                driver = self.driver()
+                session = (driver.session(database, session_type, options) if options is not None
+                           else driver.session(database, session_type))
+                with self._lock:
+                    self.stats["sessions_created"] += 1
+            return PooledSession(self, key, session, reusable=reusable, owner=owner, holds_slot=holds_slot)
+        except Exception:
+            self._return_slot(key, owner, holds_slot)
+            raise
+
+    def _take_idle(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                session, _ = idle.pop()
+                if session.is_open():
+                    self.stats["sessions_reused"] += 1
+                    return session
+                self.stats["sessions_evicted"] += 1
+                self._close_quietly(session)
+        return None
+
+    def _release(self, key, session, discard, owner=None, holds_slot=True):
+        if discard or not session.is_open():
+            self._close_quietly(session)
+        else:
+            with self._lock:
+                self._idle.setdefault(key, deque()).append((session, time.monotonic()))
+        self._return_slot(key, owner, holds_slot)
+
+    def _return_slot(self, key, owner, holds_slot):
+        with self._lock:
+            if owner is not None:
+                remaining = self._held.get(owner, 0) - 1
+                if remaining > 0:
+                    self._held[owner] = remaining
+                else:
+                    self._held.pop(owner, None)
+        if holds_slot:
+            self._slots[key].release()
+
+    def evict_idle(self):
+        """Schliesst alle Sessions, die länger als idle_seconds unbenutzt sind"""
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            for idle in self._idle.values():
+                while idle and idle[0][1] < cutoff:
+                    self._close_quietly(idle.popleft()[0])
+                    self.stats["sessions_evicted"] += 1
+
+    def invalidate(self, database):
+        """Schliesst die ungenutzten Sessions einer Database (z.B. bevor sie gelöscht wird)"""
+        with self._lock:
+            for (db, _), idle in self._idle.items():
+                if db == database:
+                    while idle:
+                        self._close_quietly(idle.pop()[0])
+
+    def _drop_idle_sessions(self):
+        for idle in self._idle.values():
+            while idle:
+                self._close_quietly(idle.pop()[0])
+
+    @staticmethod
+    def _close_quietly(resource):
+        try:
+            resource.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Schliesst alle ungenutzten Sessions und den Driver"""
+        with self._lock:
+            self._drop_idle_sessions()
+            if self._driver is not None:
+                self._close_quietly(self._driver)
+                self._driver = None
+
+
+class PooledDriver:
+    """
+    Sicht auf den geteilten Driver: session() kommt aus dem Pool,
+    das Ende des `with`-Blocks schliesst den Driver nicht
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._pool.driver(), name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def session(self, database, session_type, options=None):
+        return self._pool.session(database, session_type, options)
+
+    def close(self):
+        """Der geteilte Driver bleibt offen; close_typedb_pool() schliesst ihn"""
+
+
+# Prozessweiter Pool, beim Beenden des Prozesses geschlossen
+typedb_pool = TypeDBPool()
+atexit.register(typedb_pool.close)
+
+
+def get_typedb_driver():
+    """
+    Liefert den prozessweit geteilten TypeDB Driver (mit Session-Pool)
+    """
+    return PooledDriver(typedb_pool)
+
+
+def invalidate_sessions(database=DATABASE_NAME):
+    """Verwirft gepoolte Sessions einer Database, z.B. vor dem Löschen"""
+    typedb_pool.invalidate(database)
+
+
+def close_typedb_pool():
+    """Schliesst Driver und alle Sessions des Pools"""
+    typedb_pool.close()
+
 def print_config():
     """Gibt aktuelle Konfiguration aus"""
     print(f"Server: {TYPEDB_SERVER}")
@@ -0,0 +1,230 @@
+"""
+TypeQL Query Builder
+Vorkompilierte Statement-Templates mit korrektem Literal-Escaping
+
+Templates werden einmal beim Import zerlegt; pro Datensatz werden nur
+noch die Werte als TypeQL-Literale eingesetzt. Variablen erhalten beim
+Binden ein Suffix, damit viele gebundene Statements in einer einzigen
+Query zusammengefasst werden können.
+
+Verwendung:
+    from typeql_builder import PERSON_INSERT, batched_queries
+
+    statements = (PERSON_INSERT.bind(i, person_id=p["id"], name=p["name"]) for i, p in enumerate(persons))
+    for query in batched_queries(statements):
+        tx.query.insert(query)
+"""
+
+import math
+import re
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Iterable, Iterator, NamedTuple
+
+# Statements pro Query in batched_queries()
+DEFAULT_BATCH_SIZE = 50
+
+# {feld} = Wert-Platzhalter, $var = Variable
+_PLACEHOLDER = re.compile(r"\{([a-z_][a-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_-]*)")
+
+
+def literal(value) -> str:
+    """
+    Python-Wert als TypeQL-Literal
+
+    Strings werden in Anführungszeichen gesetzt, Backslash und " escaped
+    (Zeilenumbrüche sind in TypeQL-Strings erlaubt). datetime wird auf
+    Millisekunden gekürzt, zeitzonenbehaftete Werte nach UTC umgerechnet.
+    """
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"TypeQL kennt keinen Wert {value}")
+        text = repr(value)
+        # TypeQL kennt keine Exponentenschreibweise; Decimal(repr) behält alle Stellen
+        if "e" in text:
+            text = format(Decimal(text), "f")
+            if "." not in text:
+                text += ".0"
+        return text
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="milliseconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Kein TypeQL-Literal für {type(value).__name__}: {value!r}")
+
+
+class Template:
+    """
+    Vorkompilierte TypeQL-Statementform
+
+    - {feld}: Wert, wird mit literal() eingesetzt
+    - $var:   Variable; ausser den shared-Variablen bekommt jede beim
+              Binden das Suffix angehängt ($person -> $person3)
+    """
+
+    def __init__(self, text: str, shared: Iterable[str] = ()):
+        self.text = text
+        self.shared = frozenset(shared)
+
+        # Teile: ("text", str) | ("field", name) | ("var", name); Konstantes wird zusammengefasst
+        parts = []
+        pending = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(text):
+            pending.append(text[position:match.start()])
+            field, variable = match.groups()
+            if variable is not None and variable in self.shared:
+                pending.append(match.group(0))
+            else:
+                parts.append(("text", "".join(pending)))
+                pending = []
+                parts.append(("field", field) if field else ("var", "$" + variable))
+            position = match.end()
+        pending.append(text[position:])
+        parts.append(("text", "".join(pending)))
+
+        self._parts = [(kind, value) for kind, value in parts if kind != "text" or value]
+        self.fields = sorted({value for kind, value in self._parts if kind == "field"})
+
+    def bind(self, suffix="", **values) -> str:
+        suffix = str(suffix)
+        out = []
+        for kind, value in self._parts:
+            if kind == "text":
+                out.append(value)
+            elif kind == "var":
+                out.append(value + suffix)
+            else:
+                try:
+                    out.append(literal(values[value]))
+                except KeyError:
+                    raise ValueError(f"Wert für {{{value}}} fehlt in Template: {self.text.strip()}") from None
+        return "".join(out)
+
+
+class BoundStatement(NamedTuple):
+    match: str
+    insert: str
+
+
+class Statement:
+    """Statementform aus optionalem match-Teil und insert-Teil (gleiche Variablen-Suffixe)"""
+
+    def __init__(self, insert: str, match: str = "", shared: Iterable[str] = ()):
+        self.match = Template(match, shared) if match else None
+        self.insert = Template(insert, shared)
+
+    def bind(self, suffix="", **values) -> BoundStatement:
+        return BoundStatement(
+            self.match.bind(suffix, **values) if self.match else "",
+            self.insert.bind(suffix, **values)
+        )
+
+
+def build_query(statements: Iterable[BoundStatement], match: str = "") -> str:
+    """Eine insert- bzw. match-insert-Query aus gebundenen Statements und optionalem gemeinsamem match"""
+    statements = list(statements)
+    match_parts = [part for part in [match] + [s.match for s in statements] if part]
+    insert = "insert\n" + "\n".join(s.insert for s in statements)
+    if match_parts:
+        return "match\n" + "\n".join(match_parts) + "\n" + insert
+    return insert
+
+
+def batched_queries(statements: Iterable[BoundStatement], match: str = "",
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Fasst gebundene Statements zu Queries mit je höchstens batch_size Statements zusammen
+
+    Das gemeinsame match (z.B. die Transkription) steht einmal pro Query.
+    Statements mit eigenem match-Teil (z.B. PARTICIPATION) bekommen je eine
+    eigene Query: fände ihr match in einer gemeinsamen Query nichts, würde
+    die ganze Query nichts schreiben und nicht nur diese Zeile fehlen.
+    """
+    batch = []
+    for statement in statements:
+        if statement.match:
+            yield build_query([statement], match)
+            continue
+        batch.append(statement)
+        if len(batch) >= batch_size:
+            yield build_query(batch, match)
+            batch = []
+    if batch:
+        yield build_query(batch, match)
+
+
+# --- Statementformen ---------------------------------------------------------
+
+PERSON_INSERT = Statement(
+    "$person isa person, has person-id {person_id}, has name {name};"
+)
+PERSON_DETAILS_INSERT = Statement(
+    "$person isa person, has person-id {person_id}, has name {name}, has email {email},"
+    " has phone-number {phone}, has person-role {role}, has department {department};"
+)
+MEETING_INSERT = Statement(
+    "$meeting isa meeting, has meeting-id {meeting_id}, has title {title}, has status {status},"
+    " has start-time {start_time}, has end-time {end_time}, has location {location};"
+)
+MEETING_MATCH = Template("$meeting isa meeting, has meeting-id {meeting_id};", shared=("meeting",))
+PARTICIPATION = Statement(
+    match="$person isa person, has person-id {person_id};",
+    insert="(meeting: $meeting, participant: $person) isa meeting-participation,"
+           " has attendance-status {attendance};",
+    shared=("meeting",)
+)
+AGENDA_ITEM_INSERT = Statement(
+    "$item isa agenda-item, has agenda-item-id {item_id}, has title {title}, has description {description},"
+    " has priority {priority}, has estimated-duration {duration};"
+)
+AGENDA_LINK = Statement(
+    match="$item isa agenda-item, has agenda-item-id {item_id};",
+    insert="(meeting: $meeting, item: $item) isa meeting-agenda, has agenda-order {order};",
+    shared=("meeting",)
+)
+
+TRANSCRIPTION_INSERT = Statement(
+    "$transcription isa transcription, has transcription-id {transcription_id},"
+    " has full-text {full_text}, has language {language}, has created-at {created_at};",
+    shared=("transcription",)
+)
+TRANSCRIPTION_HEADER_INSERT = Statement(
+    "$transcription isa transcription, has transcription-id {transcription_id},"
+    " has language {language}, has created-at {created_at};",
+    shared=("transcription",)
+)
+TRANSCRIPTION_MATCH = Template(
+    "$transcription isa transcription, has transcription-id {transcription_id};", shared=("transcription",)
+)
+TRANSCRIPTION_MEETING_LINK = Statement(
+    match="$meeting isa meeting, has meeting-id {meeting_id};",
+    insert="(recorded-meeting: $meeting, meeting-transcription: $transcription) isa transcription-of-meeting;",
+    shared=("transcription", "meeting")
+)
+PROTOCOL_INSERT = Statement(
+    "$protocol isa protocol, has protocol-id {protocol_id}, has content-markdown {content},"
+    " has created-at {created_at};\n"
+    "(source-transcription: $transcription, generated-protocol: $protocol) isa protocol-generation;",
+    shared=("transcription",)
+)
+TOPIC_DISCUSSION = Statement(
+    "$topic isa agenda-item, has item-id {item_id}, has topic {title}, has description {description},"
+    " has priority {priority}, has order-index {order_index}, has status {status};\n"
+    "(discussed-in: $transcription, agenda-topic: $topic) isa topic-discussion;",
+    shared=("transcription",)
+)
+SEGMENT_INSERT = Statement(
+    "$segment isa transcript-segment, has segment-id {segment_id}, has segment-text {text},"
+    " has order-index {order_index}, has timestamp-in-recording {start}, has segment-end {end};\n"
+    "(transcription: $transcription, segment: $segment) isa transcription-segment;",
+    shared=("transcription",)
+)
@@ -0,0 +1,203 @@
+"""
+WHOIS / RDAP client for the domain checker
+
+Replaces per-call python-whois lookups for known TLDs:
+- RDAP over HTTPS with a pooled keep-alive HTTP client where the registry offers it
+- Direct port-43 queries against a precomputed TLD -> WHOIS server table otherwise
+- Compiled per-registry "not found" patterns for a fast availability verdict
+
+Server tables can be overridden (host:port for WHOIS, base URL for RDAP),
+which lets tests run against local stand-in servers.
+"""
+
+import asyncio
+import re
+from typing import Any, Dict, Optional
+
+# RDAP base URLs (IANA bootstrap registry, RFC 9224); queries go to <base>domain/<name>
+RDAP_SERVERS = {
+    "com": "https://rdap.verisign.com/com/v1/",
+    "net": "https://rdap.verisign.com/net/v1/",
+    "org": "https://rdap.publicinterestregistry.org/rdap/",
+    "ch": "https://rdap.nic.ch/",
+    "li": "https://rdap.nic.ch/",
+    "app": "https://pubapi.registry.google/rdap/",
+    "dev": "https://pubapi.registry.google/rdap/",
+    "xyz": "https://rdap.centralnic.com/xyz/",
+}
+
+# Port-43 WHOIS servers for TLDs without a usable RDAP service
+WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.pir.org",
+    "de": "whois.denic.de",
+    "at": "whois.nic.at",
+    "eu": "whois.eu",
+    "uk": "whois.nic.uk",
+    "fr": "whois.nic.fr",
+    "nl": "whois.domain-registry.nl",
+    "io": "whois.nic.io",
+    "ai": "whois.nic.ai",
+    "co": "whois.nic.co",
+    "me": "whois.nic.me",
+    "info": "whois.nic.info",
+    "xyz": "whois.nic.xyz",
+}
+
+# Some registries expect extra query flags (DENIC only returns the status without -T dn)
+WHOIS_QUERY_FORMAT = {
+    "whois.denic.de": "-T dn {domain}",
+}
+
+# "Domain not registered" answers per registry, compiled once at import
+NOT_FOUND_PATTERNS = {
+    server: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for server, pattern in {
+        "whois.verisign-grs.com": r"^No match for",
+        "whois.pir.org": r"^(NOT FOUND|Domain not found)",
+        "whois.denic.de": r"^Status:\s*free",
+        "whois.nic.at": r"% nothing found",
+        "whois.eu": r"^Status:\s*AVAILABLE",
+        "whois.nic.uk": r"No match for",
+        "whois.nic.fr": r"^%+ No entries found",
+        "whois.domain-registry.nl": r"is free",
+    }.items()
+}
+DEFAULT_NOT_FOUND = re.compile(
+    r"no match|not found|no data found|no entries found|status:\s*(free|available)|is available for registration",
+    re.IGNORECASE
+)
+RATE_LIMIT_PATTERN = re.compile(r"rate limit|limit exceeded|too many|quota", re.IGNORECASE)
+REGISTRAR_PATTERN = re.compile(r"^\s*Registrar(?: Name)?:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+REGISTERED_PATTERN = re.compile(r"^\s*(Domain Name|Domain|Registrar|Creation Date|Created):", re.IGNORECASE | re.MULTILINE)
+
+
+class WhoisClient:
+    """Async WHOIS/RDAP lookups with server tables and a pooled HTTP client
+
+    lookup() returns the same result shape as DomainChecker's WHOIS probe
+    (available/reason plus registrar and status where known), or None when
+    the TLD is in neither table so the caller can fall back to python-whois.
+    """
+
+    def __init__(self, rdap_servers: Optional[Dict[str, str]] = None,
+                 whois_servers: Optional[Dict[str, str]] = None,
+                 timeout: float = 10.0, max_connections: int = 20,
+                 per_server_concurrency: int = 4):
+        self.rdap_servers = RDAP_SERVERS if rdap_servers is None else rdap_servers
+        self.whois_servers = WHOIS_SERVERS if whois_servers is None else whois_servers
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.per_server_concurrency = per_server_concurrency
+        self._http = None
+        self._server_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _http_client(self):
+        """Shared keep-alive HTTP client, created on first RDAP query"""
+        if self._http is None:
+            import httpx
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"Accept": "application/rdap+json"},
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections)
+            )
+        return self._http
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def lookup(self, domain: str) -> Optional[Dict[str, Any]]:
+        tld = domain.rsplit(".", 1)[-1].lower()
+        if tld in self.rdap_servers:
+            return await self.lookup_rdap(domain, self.rdap_servers[tld])
+        if tld in self.whois_servers:
+            return await self.lookup_whois(domain, self.whois_servers[tld])
+        return None
+
+    async def lookup_rdap(self, domain: str, base_url: str) -> Dict[str, Any]:
+        """RDAP domain query: 404 means unregistered, 200 carries status and registrar"""
+        url = f"{base_url.rstrip('/')}/domain/{domain}"
+        response = await self._http_client().get(url)
+
+        if response.status_code == 404:
+            return {"available": True, "reason": "RDAP: domain not found", "source": "rdap"}
+        if response.status_code == 429:
+            return {"available": None, "reason": "RDAP rate limit exceeded", "source": "rdap"}
+        if response.status_code != 200:
+            return {"available": None, "reason": f"RDAP lookup failed: HTTP {response.status_code}", "source": "rdap"}
+
+        data = response.json()
+        registrar = None
+        for entity in data.get("entities", []):
+            if "registrar" in entity.get("roles", []):
+                # vcardArray: ["vcard", [["fn", {}, "text", "Registrar Name"], ...]]
+                for field in (entity.get("vcardArray") or [None, []])[1]:
+                    if field and field[0] == "fn":
+                        registrar = field[3]
+        creation_date = next(
+            (event.get("eventDate") for event in data.get("events", []) if event.get("eventAction") == "registration"),
+            None
+        )
+
+        return {
+            "available": False,
+            "reason": "Domain has active status",
+            "status": data.get("status", []),
+            "registrar": registrar,
+            "creation_date": creation_date,
+            "source": "rdap"
+        }
+
+    async def _query_port43(self, server: str, query: str) -> str:
+        host, _, port = server.partition(":")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, int(port or 43)), self.timeout
+        )
+        try:
+            writer.write(f"{query}\r\n".encode("utf-8"))
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), self.timeout)
+        finally:
+            writer.close()
+        return data.decode("utf-8", errors="replace")
+
+    async def lookup_whois(self, domain: str, server: str) -> Dict[str, Any]:
+        """Port-43 WHOIS query, matched against the registry's compiled patterns
+
+        RFC 3912 servers close the connection after each answer, so port-43
+        connections cannot be reused; a per-server semaphore bounds how many
+        are open at once instead.
+        """
+        semaphore = self._server_semaphores.setdefault(server, asyncio.Semaphore(self.per_server_concurrency))
+        host = server.partition(":")[0]
+        query = WHOIS_QUERY_FORMAT.get(host, "{domain}").format(domain=domain)
+
+        async with semaphore:
+            text = await self._query_port43(server, query)
+
+        not_found = NOT_FOUND_PATTERNS.get(host, DEFAULT_NOT_FOUND)
+        if not_found.search(text):
+            return {"available": True, "reason": "WHOIS: no match", "source": "whois", "server": host}
+        if RATE_LIMIT_PATTERN.search(text):
+            return {"available": None, "reason": "WHOIS rate limit exceeded", "source": "whois", "server": host}
+        if REGISTERED_PATTERN.search(text):
+            registrar = REGISTRAR_PATTERN.search(text)
+            return {
+                "available": False,
+                "reason": "Domain has registrar" if registrar else "Domain has WHOIS record",
+                "registrar": registrar.group(1).strip() if registrar else None,
+                "source": "whois",
+                "server": host
+            }
+        return {
+            "available": None,
+            "reason": "WHOIS data exists but unclear status",
+            "raw_data": text[:500],
+            "source": "whois",
+            "server": host
+        }